@@ -0,0 +1,22 @@
+"""Generated by scripts/generate_realish_screenshots.py alongside
+docs/screenshots/realish-hashes.json. Do not edit by hand."""
+
+ALGO = 'blake2b'
+
+HASHES: frozenset[str] = frozenset({
+    '175c05f909d67057f0820e36827c5eb7',
+    '37c00322664fff1d50f9b8e52a73867f',
+    '9040caee171571e66c71b1e4d0e13603',
+    'a4087bbf8fcb3247662306139a68fd7b',
+    'e9ee6a36595896920ee74e14b15075ad',
+    'f82aae9718d851a94113572ef7e9ff24',
+})
+
+SIZES: dict[str, int] = {
+    '01-menu.png': 49957,
+    '02-requests-pending.png': 56746,
+    '03-approved-row.png': 46600,
+    '04-audit-entry.png': 43533,
+    '05-reapproval-required.png': 92707,
+    '06-help-sidebar.png': 93921,
+}
@@ -0,0 +1,113 @@
+"""Zip helpers shared by the pack builders (make_screenshot_pack.py,
+make_real_screenshot_capture_pack.py, make_marketplace_pack.py).
+
+Imported in-process: scripts/ is on sys.path when those run as scripts.
+
+Optional: with `pip install isal`, importing this module routes zipfile's deflate and CRC32
+through ISA-L (faster, same format). zipfile has no per-archive hook for that, so the swap is
+process-global and happens once, here: every zip written afterwards in this interpreter uses
+it, including the bundle make_marketplace_pack.py builds on another thread. The output is
+standard deflate either way, only the bytes of the compressed stream differ.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import zipfile
+import zlib
+from pathlib import Path
+
+
+# Already-compressed formats: deflating them again costs CPU for ~0% size change.
+STORED_SUFFIXES = frozenset({".zip", ".png", ".jpg", ".jpeg", ".gif", ".webp"})
+
+# Every entry gets this timestamp, so unchanged inputs produce a byte-identical zip.
+REPRO_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+# add_file copy buffer: peak memory per entry is one chunk, not the whole file.
+COPY_CHUNK = 1 << 20
+
+
+def compress_type(name: str, stored_suffixes: frozenset[str] | set[str] = STORED_SUFFIXES) -> int:
+    return zipfile.ZIP_STORED if os.path.splitext(name)[1].lower() in stored_suffixes else zipfile.ZIP_DEFLATED
+
+
+def add_file(z: zipfile.ZipFile, src: Path, arcname: str, compress_type: int | None = None) -> None:
+    """z.write(src, arcname), but with REPRO_DATE_TIME instead of the file's mtime.
+
+    Copies through z.open(zi, "w") in COPY_CHUNK pieces (ZipFile.write uses 8 KiB). Mode bits
+    and size come from fstat on the open file; the size lets zipfile pick zip64 on its own.
+    """
+    with open(src, "rb") as f:
+        st = os.fstat(f.fileno())
+        zi = zipfile.ZipInfo(arcname, date_time=REPRO_DATE_TIME)
+        zi.external_attr = (st.st_mode & 0xFFFF) << 16
+        zi.file_size = st.st_size
+        zi.compress_type = z.compression if compress_type is None else compress_type
+        _set_compress_level(zi, z.compresslevel)
+        with z.open(zi, "w") as dst:
+            shutil.copyfileobj(f, dst, COPY_CHUNK)
+
+
+def _set_compress_level(zi: zipfile.ZipInfo, level: int | None) -> None:
+    # What ZipFile.write/writestr do: 3.13 made the field public as compress_level; 3.11/3.12
+    # only have _compresslevel. z.open(zi, "w") has no compresslevel argument of its own.
+    if hasattr(zipfile.ZipInfo, "compress_level"):
+        zi.compress_level = level
+    else:
+        zi._compresslevel = level
+
+
+def add_bytes(z: zipfile.ZipFile, arcname: str, data: bytes | str, mode: int = 0o644) -> None:
+    """writestr() for a generated entry: REPRO_DATE_TIME and mode, compressed like the rest of the zip."""
+    zi = zipfile.ZipInfo(arcname, date_time=REPRO_DATE_TIME)
+    zi.external_attr = mode << 16
+    z.writestr(zi, data, compress_type=z.compression, compresslevel=z.compresslevel)
+
+
+def existing_files(paths: list[Path]) -> set[Path]:
+    """The subset of paths that are files: one os.scandir per parent directory, not a stat per path."""
+    by_parent: dict[Path, list[Path]] = {}
+    for p in paths:
+        by_parent.setdefault(p.parent, []).append(p)
+    present: set[Path] = set()
+    for parent, group in by_parent.items():
+        try:
+            with os.scandir(parent) as it:
+                names = {e.name for e in it if e.is_file()}
+        except OSError:
+            continue
+        present.update(p for p in group if p.name in names)
+    return present
+
+
+# zlib compression levels -> ISA-L's 0-3 (-1 is zlib's default, level 6).
+_ISAL_LEVELS = {-1: 2, 0: 0, 1: 1, 2: 1, 3: 1, 4: 2, 5: 2, 6: 2, 7: 3, 8: 3, 9: 3}
+
+
+class _IsalZlib:
+    """zlib stand-in for zipfile: ISA-L deflate + CRC32 (same wire format), everything else zlib.
+
+    A bare `zipfile.zlib = isal_zlib` isn't enough: zipfile asks for zlib's levels (-1, 6, ...),
+    which ISA-L (0-3) rejects.
+    """
+
+    def __init__(self, isal_zlib) -> None:
+        self._isal = isal_zlib
+        self.crc32 = isal_zlib.crc32
+
+    def compressobj(self, level: int = -1, method: int = zlib.DEFLATED, wbits: int = zlib.MAX_WBITS, *args):
+        return self._isal.compressobj(_ISAL_LEVELS.get(level, 2), method, wbits)
+
+    def __getattr__(self, name: str):
+        return getattr(zlib, name)
+
+
+try:
+    from isal import isal_zlib
+except ImportError:
+    pass
+else:
+    zipfile.zlib = _IsalZlib(isal_zlib)
+    zipfile.crc32 = isal_zlib.crc32
@@ -11,11 +11,22 @@ This copies:
 
 And rewrites landing/index.html links from "../X" to "X" so they resolve
 within the built site.
+
+Builds are incremental: dist/site is synced in place (files whose size+mtime
+already match are skipped, files no longer in the source are deleted).
+
+Usage:
+  python3 scripts/build_gh_pages_site.py
+  python3 scripts/build_gh_pages_site.py --clean   # wipe dist/site first
 """
 
 from __future__ import annotations
 
+import argparse
+import os
+import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
@@ -24,6 +35,9 @@ OUT_DIR = REPO_ROOT / "dist" / "site"
 LANDING_DIR = REPO_ROOT / "landing"
 PNG_DIR = REPO_ROOT / "docs" / "screenshots" / "png"
 
+# Matches href="../ and src="../ so both rewrites happen in one pass over index.html.
+_REWRITE_RE = re.compile(r'(\b(?:href|src))="\.\./')
+
 DOC_FILES = [
     "README.md",
     "ONE_PAGER.md",
@@ -37,45 +51,105 @@ DOC_FILES = [
 ]
 
 
+def _scan_files(d: Path) -> list[os.DirEntry]:
+    """Regular files directly under d (os.scandir: no per-entry Path objects or extra stat)."""
+    with os.scandir(d) as it:
+        return [de for de in it if de.is_file(follow_symlinks=False)]
+
+
+def _copy_one(src: str | Path, dst: Path) -> None:
+    """copyfile(src, dst) unless dst already has src's (size, mtime_ns).
+
+    Copies are stamped with src's mtime so the next build can compare by stat alone.
+    """
+    st = os.stat(src)
+    try:
+        dst_st = dst.stat()
+        if dst_st.st_size == st.st_size and dst_st.st_mtime_ns == st.st_mtime_ns:
+            return
+    except FileNotFoundError:
+        pass
+    shutil.copyfile(src, dst)
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def _copy_all(pairs: list[tuple[str | Path, Path]]) -> None:
+    """Copy (src, dst) pairs on a small thread pool (copyfile releases the GIL during I/O).
+
+    dist/site is a throwaway build dir, so mode bits are not preserved: plain copyfile
+    skips copy2's stat/chmod/xattr calls and can use the kernel zero-copy path.
+    """
+    if not pairs:
+        return
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as ex:
+        # list() drains the iterator so worker exceptions are re-raised here.
+        list(ex.map(lambda pair: _copy_one(*pair), pairs))
+
+
+def _prune_dir(dst_dir: Path, pairs: list[tuple[str | Path, Path]], keep: frozenset[str] = frozenset()) -> None:
+    """Unlink files directly under dst_dir that are not a dst of pairs (or in keep).
+
+    Together with _copy_all this syncs dst_dir in place. Subdirectories are left alone.
+    """
+    wanted = {Path(dst).name for _, dst in pairs} | keep
+    for de in _scan_files(dst_dir):
+        if de.name not in wanted:
+            os.unlink(de.path)
+
+
 def main() -> None:
+    ap = argparse.ArgumentParser(description="Build the GitHub Pages site into dist/site.")
+    ap.add_argument(
+        "--clean",
+        action="store_true",
+        help="Delete dist/site before building instead of syncing it in place.",
+    )
+    args = ap.parse_args()
+
     if not LANDING_DIR.exists():
         raise SystemExit(f"missing landing dir: {LANDING_DIR}")
 
-    if OUT_DIR.exists():
+    if OUT_DIR.exists() and args.clean:
         shutil.rmtree(OUT_DIR)
     OUT_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Copy landing assets (style.css etc)
-    for p in LANDING_DIR.iterdir():
-        if p.is_dir():
-            continue
-        if p.name == "index.html":
-            continue
-        shutil.copy2(p, OUT_DIR / p.name)
+    # Landing assets (style.css etc) + markdown docs share the site root.
+    root_pairs: list[tuple[str | Path, Path]] = [
+        (de.path, OUT_DIR / de.name) for de in _scan_files(LANDING_DIR) if de.name != "index.html"
+    ]
+    for name in DOC_FILES:
+        src = REPO_ROOT / name
+        if src.exists():
+            root_pairs.append((src, OUT_DIR / name))
+
+    # Screenshot PNGs
+    dst_png = OUT_DIR / "docs" / "screenshots" / "png"
+    png_pairs: list[tuple[str | Path, Path]] = []
+    if PNG_DIR.exists():
+        dst_png.mkdir(parents=True, exist_ok=True)
+        png_pairs = [(de.path, dst_png / de.name) for de in _scan_files(PNG_DIR) if de.name.endswith(".png")]
+    elif dst_png.exists():
+        shutil.rmtree(dst_png)
+
+    # One pool for every copy (landing assets, docs, PNGs) so their I/O overlaps.
+    _copy_all(root_pairs + png_pairs)
+    _prune_dir(OUT_DIR, root_pairs, keep=frozenset({"index.html"}))
+    if PNG_DIR.exists():
+        _prune_dir(dst_png, png_pairs)
 
     # Rewrite index.html for site root
     src_index = (LANDING_DIR / "index.html").read_text(encoding="utf-8")
 
     # Make ../ links resolve at site root
-    rewritten = src_index.replace('href="../', 'href="').replace('src="../', 'src="')
+    rewritten = _REWRITE_RE.sub(r'\1="', src_index)
 
     # Ensure the landing <title> is sane for Pages.
     # (No-op unless someone changes it upstream.)
 
-    (OUT_DIR / "index.html").write_text(rewritten, encoding="utf-8")
-
-    # Copy markdown docs into site root
-    for name in DOC_FILES:
-        src = REPO_ROOT / name
-        if src.exists():
-            shutil.copy2(src, OUT_DIR / name)
-
-    # Copy screenshot PNGs
-    if PNG_DIR.exists():
-        dst_png = OUT_DIR / "docs" / "screenshots" / "png"
-        dst_png.mkdir(parents=True, exist_ok=True)
-        for p in PNG_DIR.glob("*.png"):
-            shutil.copy2(p, dst_png / p.name)
+    # The rewrite output has no source mtime to compare, so compare content instead.
+    out_index = OUT_DIR / "index.html"
+    if not (out_index.exists() and out_index.read_text(encoding="utf-8") == rewritten):
+        out_index.write_text(rewritten, encoding="utf-8")
 
     print(f"built: {OUT_DIR}")
 
@@ -12,6 +12,8 @@ This script prompts you shot-by-shot:
 
 Notes:
 - macOS only (uses `osascript` to read clipboard as PNG).
+- Faster for large Retina captures: `brew install pngpaste` — when present it is used instead
+  of AppleScript (which marshals the whole image through the scripting bridge).
 - It will, by default, only capture shots that are currently "real-ish" (generated)
   or missing. Use `--all` to capture everything.
 
@@ -27,14 +29,20 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import hashlib
+import atexit
 import json
 import os
 from pathlib import Path
+import re
+import shutil
 import subprocess
 import sys
 import time
 
+# Shared helpers live in check_screenshots.py (shipped alongside in the capture pack);
+# scripts/ is on sys.path when this runs as a script.
+import check_screenshots
+
 
 ROOT = Path(__file__).resolve().parents[1]
 
@@ -49,40 +57,64 @@ DEFAULT_SHOTLIST = [
 
 DEFAULT_SHOTLIST_MD = "docs/screenshots/REAL_SCREENSHOTS_SHOTLIST.md"
 
+# One shotlist section: a "## " header naming `<file>.png`, up to the next "## " header or EOF.
+_SHOT_SECTION_RE = re.compile(r"^## [^\n]*?`([^`\n]+\.png)`.*?(?=^## |\Z)", re.DOTALL | re.MULTILINE)
 
-def _sha256(path: Path) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
-    return h.hexdigest()
+REALISH_MANIFEST_PATH = ROOT / "docs" / "screenshots" / "realish-hashes.json"
 
 
-def _load_realish_hashes(realish_hashes_path: Path) -> set[str]:
+def _realish_module(realish_hashes_path: Path):
+    """The generated scripts/_realish_hashes.py mirror of the default manifest, or None."""
+    if realish_hashes_path != REALISH_MANIFEST_PATH:
+        return None
+    try:
+        import _realish_hashes  # written by generate_realish_screenshots.py next to this script
+    except ImportError:
+        return None
+    return _realish_hashes
+
+
+def _load_realish_hashes(realish_hashes_path: Path) -> tuple[str, frozenset[str] | set[str]]:
+    """Return (algo, digests). Anything without an explicit "algo" field is sha256."""
+    m = _realish_module(realish_hashes_path)
+    if m is not None:
+        return m.ALGO, m.HASHES
     try:
         data = json.loads(realish_hashes_path.read_text(encoding="utf-8"))
         if isinstance(data, list):
-            return set(str(x) for x in data)
+            return "sha256", set(str(x) for x in data)
         if isinstance(data, dict) and "sha256" in data and isinstance(data["sha256"], list):
-            return set(str(x) for x in data["sha256"])
-        # common format in this repo: {"files": {name: sha}} or {name: sha}
+            return "sha256", set(str(x) for x in data["sha256"])
+        # common format in this repo: {"algo": ..., "files": {name: digest}} or {name: sha}
         if isinstance(data, dict):
+            algo = str(data.get("algo") or "sha256")
             hashes: list[str] = []
             if "files" in data and isinstance(data["files"], dict):
                 hashes.extend(str(v) for v in data["files"].values())
             else:
-                hashes.extend(str(v) for v in data.values() if isinstance(v, str))
-            return set(hashes)
+                hashes.extend(str(v) for k, v in data.items() if isinstance(v, str) and k != "algo")
+            return algo, set(hashes)
     except Exception:
-        return set()
-    return set()
-
-
-def _needs_replacement(target: Path, realish_hashes: set[str]) -> bool:
-    if not target.exists():
+        return "sha256", set()
+    return "sha256", set()
+
+
+def _needs_replacement(
+    entry: os.DirEntry | None,
+    realish_algo: str,
+    realish_hashes: frozenset[str] | set[str],
+    hash_cache: dict[str, list],
+    realish_sizes: frozenset[int],
+) -> bool:
+    """entry is the target's DirEntry from one scandir of the target dir (None = file missing)."""
+    if entry is None:
         return True
     try:
-        return _sha256(target) in realish_hashes
+        st = entry.stat()
+        # A real capture almost never has the exact byte size of a generated mock: skip hashing it.
+        if realish_sizes and st.st_size not in realish_sizes:
+            return False
+        return check_screenshots.cached_digest(Path(entry.path), hash_cache, realish_algo, st) in realish_hashes
     except Exception:
         return True
 
@@ -94,67 +126,161 @@ def _parse_shot_instructions(md_path: Path) -> dict[str, str]:
       ## 01 — `01-menu.png` (...)
       ...
 
-    and capture text until the next "##" header.
+    and capture text (header included) until the next "##" header, in one regex pass.
     """
 
     if not md_path.exists():
         return {}
 
-    out: dict[str, str] = {}
-    cur_name: str | None = None
-    cur_lines: list[str] = []
+    text = md_path.read_text(encoding="utf-8")
+    return {m.group(1): m.group(0).strip() for m in _SHOT_SECTION_RE.finditer(text)}
+
 
-    lines = md_path.read_text(encoding="utf-8").splitlines()
-    for line in lines:
-        if line.startswith("## "):
-            # flush previous
-            if cur_name and cur_lines:
-                out[cur_name] = "\n".join(cur_lines).strip()
+def _applescript_str(s: str) -> str:
+    """s as an AppleScript string literal."""
+    return '"' + s.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
 
-            cur_name = None
-            cur_lines = []
 
-            # find `filename.png` inside backticks
-            if "`" in line:
-                parts = line.split("`")
-                for p in parts:
-                    if p.endswith(".png"):
-                        cur_name = p
-                        break
+def _check_result(lines: list[str], cmd: list[str]) -> None:
+    """Raise CalledProcessError unless the script reported "OK" (scripts return "OK" or "ERR:<message>").
 
-            # keep the header as context (minus leading ##)
-            if cur_name:
-                cur_lines.append(line)
-            continue
+    Keys off those explicit markers rather than the wording of osascript's own diagnostics;
+    a compile error, which yields neither, also counts as a failure.
+    """
+    if any(ln.startswith("ERR:") for ln in lines) or "OK" not in lines:
+        raise subprocess.CalledProcessError(1, cmd, stderr="\n".join(lines))
 
-        if cur_name is not None:
-            cur_lines.append(line)
 
-    if cur_name and cur_lines:
-        out[cur_name] = "\n".join(cur_lines).strip()
+class _OsascriptSession:
+    """One long-lived `osascript -i` process shared by every capture.
+
+    Spawning osascript costs tens of ms per shot (hundreds on a cold start). The REPL compiles
+    one line at a time, so each script goes in as a single `log (run script "...")` line (its
+    try/on error block runs as one unit), followed by a `log` sentinel; what osascript writes to
+    stderr before the sentinel is the script's result plus any diagnostics.
+    """
 
-    return out
+    SENTINEL = "__capture_clipboard_shotlist_done__"
+
+    def __init__(self) -> None:
+        self.proc = subprocess.Popen(
+            ["osascript", "-i"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        )
+
+    def run(self, script: str) -> None:
+        """Run script (see _check_result); CalledProcessError on failure, RuntimeError if the session died."""
+        proc = self.proc
+        if proc.poll() is not None or proc.stdin is None or proc.stderr is None:
+            raise RuntimeError("osascript session is not running")
+        try:
+            proc.stdin.write(f"log (run script {_applescript_str(script.strip())})\n")
+            proc.stdin.write(f'log "{self.SENTINEL}"\n')
+            proc.stdin.flush()
+        except OSError as e:
+            raise RuntimeError(f"osascript session is not running ({e})") from e
+
+        output: list[str] = []
+        for line in proc.stderr:
+            if self.SENTINEL in line:
+                break
+            output.append(line.strip())
+        else:
+            raise RuntimeError("osascript session exited")
+
+        _check_result(output, ["osascript", "-i"])
+
+    def close(self) -> None:
+        if self.proc.poll() is not None:
+            return
+        try:
+            if self.proc.stdin is not None:
+                self.proc.stdin.close()
+            self.proc.wait(timeout=2)
+        except Exception:
+            self.proc.kill()
+
+
+_SESSION: _OsascriptSession | None = None
+
+
+def _osascript_session() -> _OsascriptSession | None:
+    """Lazily start the shared session (None if osascript can't be started)."""
+    global _SESSION
+    if _SESSION is None or _SESSION.proc.poll() is not None:
+        try:
+            _SESSION = _OsascriptSession()
+        except OSError:
+            return None
+        atexit.register(_SESSION.close)
+    return _SESSION
 
 
 def _write_clipboard_png(out_path: Path) -> None:
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Write clipboard PNG bytes to a file using AppleScript.
-    # If clipboard doesn't contain an image, osascript will error.
+    # Preferred: pngpaste reads NSPasteboard directly and writes the PNG itself.
+    # It exits non-zero (CalledProcessError) when the clipboard holds no image.
+    if shutil.which("pngpaste"):
+        subprocess.run(["pngpaste", str(out_path)], check=True)
+        return
+
+    # Write clipboard PNG bytes to a file using AppleScript, as one try block: if the clipboard
+    # holds no image nothing touches the file, and a failed write still closes the handle
+    # (which would otherwise stay open in the shared session).
     script = f'''
-set theFile to (POSIX file "{str(out_path)}")
-set theData to the clipboard as «class PNGf»
-set outFile to open for access theFile with write permission
-set eof outFile to 0
-write theData to outFile
-close access outFile
+set theFile to (POSIX file {_applescript_str(str(out_path))})
+try
+    set theData to the clipboard as «class PNGf»
+    set outFile to open for access theFile with write permission
+    try
+        set eof outFile to 0
+        write theData to outFile
+    on error errMsg
+        close access outFile
+        error errMsg
+    end try
+    close access outFile
+    return "OK"
+on error errMsg
+    return "ERR:" & errMsg
+end try
 '''
 
-    subprocess.run(["osascript", "-e", script], check=True)
+    session = _osascript_session()
+    if session is not None:
+        try:
+            session.run(script)
+            return
+        except RuntimeError:
+            pass  # session died: fall back to a one-shot osascript below
+
+    cmd = ["osascript", "-e", script]
+    p = subprocess.run(cmd, capture_output=True, text=True, check=True)
+    _check_result([ln.strip() for ln in (p.stdout + p.stderr).splitlines()], cmd)
 
 
-def _get_pixels_sips(path: Path) -> tuple[int | None, int | None]:
-    """Return (width, height) using macOS 'sips'."""
+def _get_pixels(path: Path) -> tuple[int | None, int | None]:
+    """Return (width, height).
+
+    Uses Pillow when installed (reads only the PNG header, no subprocess); otherwise
+    falls back to macOS 'sips'.
+    """
+
+    try:
+        from PIL import Image
+    except ImportError:
+        Image = None  # type: ignore[assignment]
+    if Image is not None:
+        try:
+            with Image.open(path) as im:
+                return im.size
+        except Exception:
+            return None, None
 
     try:
         p = subprocess.run(
@@ -177,7 +303,9 @@ def _get_pixels_sips(path: Path) -> tuple[int | None, int | None]:
 
 
 def main() -> int:
-    ap = argparse.ArgumentParser()
+    ap = argparse.ArgumentParser(
+        epilog="Tip: `brew install pngpaste` for faster clipboard capture (used automatically when on PATH)."
+    )
     ap.add_argument(
         "--target-dir",
         default="docs/screenshots",
@@ -237,14 +365,24 @@ def main() -> int:
             return 2
 
     target_dir = ROOT / args.target_dir
-    realish_hashes = _load_realish_hashes(ROOT / "docs/screenshots/realish-hashes.json")
+    realish_algo, realish_hashes = _load_realish_hashes(REALISH_MANIFEST_PATH)
+    realish_sizes = frozenset(check_screenshots.load_realish_sizes().values())
     instructions = _parse_shot_instructions(ROOT / args.shotlist_md)
 
+    # One directory read answers "exists?" and "size?" for every shot.
+    try:
+        with os.scandir(target_dir) as it:
+            entries = {de.name: de for de in it if de.is_file()}
+    except FileNotFoundError:
+        entries = {}
+
+    hash_cache = check_screenshots.load_hash_cache()
     targets: list[Path] = []
     for name in DEFAULT_SHOTLIST:
         p = target_dir / name
-        if args.all or _needs_replacement(p, realish_hashes):
+        if args.all or _needs_replacement(entries.get(name), realish_algo, realish_hashes, hash_cache, realish_sizes):
             targets.append(p)
+    check_screenshots.save_hash_cache(hash_cache)
 
     if not targets:
         print("Nothing to capture: all required shots already look non-real-ish.")
@@ -299,7 +437,7 @@ def main() -> int:
                 continue
 
             if require_w is not None and require_h is not None:
-                w, h = _get_pixels_sips(tmp)
+                w, h = _get_pixels(tmp)
                 if (w, h) != (require_w, require_h):
                     tmp.unlink(missing_ok=True)
                     print(
@@ -11,8 +11,11 @@ During development, those files may be:
   - true screenshots captured from a real Google Sheet (preferred)
 
 Detection:
-  1) PLACEHOLDER: sha256(docs/screenshots/<name>.png) == sha256(docs/screenshots/png/<name>.png)
-  2) REALISH: sha256(docs/screenshots/<name>.png) matches docs/screenshots/realish-hashes.json
+  1) PLACEHOLDER: digest(docs/screenshots/<name>.png) == digest(docs/screenshots/png/<name>.png)
+  2) REALISH: digest(docs/screenshots/<name>.png) matches docs/screenshots/realish-hashes.json
+     (using the manifest's "algo"; manifests without one are sha256)
+
+Digests are content-identity checks only (not security), so BLAKE2b is used where we pick the algorithm.
 
 Exit codes:
   0: ok (or non-failing findings)
@@ -37,6 +40,9 @@ TOP_DIR = ROOT / "docs" / "screenshots"
 PLACEHOLDER_DIR = TOP_DIR / "png"
 REALISH_HASHES_PATH = TOP_DIR / "realish-hashes.json"
 MANIFEST_PATH = TOP_DIR / "manifest.json"
+# Local (gitignored) memo of file digests keyed by stat(), so unchanged PNGs are not re-hashed on every run.
+HASH_CACHE_PATH = ROOT / ".cache" / "screenshot-hashes.json"
+DIGEST_ALGO = "blake2b"
 
 # Back-compat fallback if manifest.json is missing/corrupt.
 FALLBACK_NAMES = [
@@ -81,26 +87,104 @@ def load_required_names() -> list[str]:
 NAMES = load_required_names()
 
 
-def sha256(p: Path) -> str:
-    h = hashlib.sha256()
+def _new_hasher(algo: str):
+    if algo == "blake2b":
+        return hashlib.blake2b(digest_size=16)
+    return hashlib.new(algo)
+
+
+def advise_sequential(f) -> None:
+    """Hint the kernel to read ahead aggressively (Linux CI; no-op where unsupported)."""
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+
+def digest(p: Path, algo: str = DIGEST_ALGO) -> str:
     with p.open("rb") as f:
+        advise_sequential(f)
+        if hasattr(hashlib, "file_digest"):
+            # Python 3.11+: hashes in C via readinto() on a reused buffer.
+            return hashlib.file_digest(f, lambda: _new_hasher(algo)).hexdigest()
+        h = _new_hasher(algo)
         for chunk in iter(lambda: f.read(1024 * 1024), b""):
             h.update(chunk)
     return h.hexdigest()
 
 
-def load_realish_hashes() -> dict[str, str]:
-    if not REALISH_HASHES_PATH.exists():
+def load_hash_cache() -> dict[str, list]:
+    """Load the {"algo:path": [mtime_ns, size, digest]} memo (empty on any error)."""
+    try:
+        payload = json.loads(HASH_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
         return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def save_hash_cache(cache: dict[str, list]) -> None:
+    try:
+        HASH_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        HASH_CACHE_PATH.write_text(json.dumps(cache, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    except OSError:
+        pass
+
+
+def cached_digest(
+    p: Path, cache: dict[str, list], algo: str = DIGEST_ALGO, st: os.stat_result | None = None
+) -> str:
+    """digest(p, algo), reusing the memoized value while (mtime_ns, size) are unchanged.
+
+    Pass st when the caller already has it (e.g. from a DirEntry) to skip another stat().
+    """
+    if st is None:
+        st = p.stat()
+    key = f"{algo}:{p}"
+    hit = cache.get(key)
+    if isinstance(hit, list) and len(hit) == 3 and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        return str(hit[2])
+    h = digest(p, algo)
+    cache[key] = [st.st_mtime_ns, st.st_size, h]
+    return h
+
+
+def load_realish_hashes() -> tuple[str, dict[str, str]]:
+    """Return (algo, {name: digest}); manifests written before the "algo" field are sha256."""
+    if not REALISH_HASHES_PATH.exists():
+        return ("sha256", {})
     try:
         payload = json.loads(REALISH_HASHES_PATH.read_text(encoding="utf-8"))
+        algo = payload.get("algo") or "sha256"
         files = payload.get("files")
-        if isinstance(files, dict):
+        if isinstance(files, dict) and isinstance(algo, str):
             out: dict[str, str] = {}
             for k, v in files.items():
                 if isinstance(k, str) and isinstance(v, str) and len(v) >= 32:
                     out[k] = v
-            return out
+            return (algo, out)
+    except Exception:
+        return ("sha256", {})
+    return ("sha256", {})
+
+
+def load_realish_sizes() -> dict[str, int]:
+    """Byte size of each generated mock ({} for manifests that predate the "sizes" field).
+
+    Prefers the scripts/_realish_hashes.py mirror that generate_realish_screenshots.py writes
+    next to this script (no JSON parse); falls back to realish-hashes.json.
+    """
+    try:
+        import _realish_hashes
+    except ImportError:
+        pass
+    else:
+        return dict(_realish_hashes.SIZES)
+    try:
+        payload = json.loads(REALISH_HASHES_PATH.read_text(encoding="utf-8"))
+        sizes = payload.get("sizes")
+        if isinstance(sizes, dict):
+            return {k: v for k, v in sizes.items() if isinstance(k, str) and isinstance(v, int)}
     except Exception:
         return {}
     return {}
@@ -137,7 +221,7 @@ def sips_px(p: Path) -> tuple[int | None, int | None]:
         return (None, None)
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument(
         "--fail-on-placeholders",
@@ -244,7 +328,7 @@ def main() -> int:
         action="store_true",
         help="macOS: open the quick-run + shotlist + cheatsheet guides in the default app.",
     )
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     def parse_pixels(s: str) -> tuple[int, int] | None:
         s = (s or "").strip().lower().replace(" ", "")
@@ -295,7 +379,9 @@ def main() -> int:
 
     info: dict[str, dict[str, int | None]] = {}
 
-    realish_hashes = load_realish_hashes()
+    realish_algo, realish_hashes = load_realish_hashes()
+    realish_sizes = load_realish_sizes()
+    hash_cache = load_hash_cache()
 
     for name in NAMES:
         top = TOP_DIR / name
@@ -309,17 +395,20 @@ def main() -> int:
             continue
 
         try:
-            top_h = sha256(top)
-            if top_h == sha256(ph):
+            size = top.stat().st_size
+            # Placeholder copies are byte-identical, so a size mismatch rules one out without hashing.
+            same_size = size == ph.stat().st_size
+            if same_size and cached_digest(top, hash_cache) == cached_digest(ph, hash_cache):
                 placeholders.append(name)
-            elif realish_hashes.get(name) == top_h:
+            elif (
+                name in realish_hashes
+                # Known mock size differs => cannot be the mock; skip hashing it.
+                and realish_sizes.get(name, size) == size
+                and realish_hashes[name] == cached_digest(top, hash_cache, realish_algo)
+            ):
                 realish.append(name)
 
             w, h = sips_px(top)
-            try:
-                size = top.stat().st_size
-            except Exception:
-                size = None
             info[name] = {"bytes": size, "width": w, "height": h}
 
             if required_pixels:
@@ -331,6 +420,8 @@ def main() -> int:
         except OSError:
             missing.append(name)
 
+    save_hash_cache(hash_cache)
+
     needs_attention: list[str] = []
     # Order: missing first (must exist), then placeholders, then known real-ish mocks, then pixel-dimension mismatches.
     needs_attention += [f"docs/screenshots/{Path(m).name}" for m in missing]
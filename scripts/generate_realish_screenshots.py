@@ -14,15 +14,23 @@ This intentionally makes the top-level PNG hashes differ from the placeholder
 PNGs so `scripts/check_screenshots.py` passes.
 
 Usage:
-  python3 scripts/generate_realish_screenshots.py [--optimize] [--watermark] [--watermark-text TEXT]
+  python3 scripts/generate_realish_screenshots.py [--optimize | --optimize-inline] [--watermark] [--watermark-text TEXT] [--no-oxipng] [--force]
 
 Options:
   --optimize         Also run the screenshot optimizer after writing PNGs
                     (generates docs/screenshots/optimized/*.jpg).
+  --optimize-inline  Write docs/screenshots/optimized/*.jpg directly from the rendered
+                    canvas (same 1400px/quality-80 settings as the Node optimizer), without
+                    re-reading the PNGs or needing node/sips.
   --watermark        Add a safety watermark ("DEMO (generated)") to the output PNGs.
                     Useful when you want to share mocks publicly without risking
                     them being mistaken for real Google Sheets captures.
   --watermark-text   Customize the watermark text (implies --watermark).
+  --no-oxipng        Don't crush the written PNGs with oxipng (used automatically
+                    when it is on PATH; Pillow itself writes at zlib level 1).
+  --force            Re-render every shot. By default a shot is skipped when its
+                    placeholder digest and watermark match the last run's manifest
+                    and its output is still in place.
 
 Notes:
 - If you later capture true screenshots from Google Sheets, you can overwrite
@@ -33,17 +41,31 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 import argparse
+import functools
+import os
+import shutil
 import subprocess
-import hashlib
 import json
 from datetime import datetime, timezone
 
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
 
+# The realness gate in check_screenshots.py re-hashes these files, so hash them with its digest()
+# (scripts/ is on sys.path when this runs as a script).
+import check_screenshots
+
 ROOT = Path(__file__).resolve().parents[1]
 TOP_DIR = ROOT / "docs" / "screenshots"
 PLACEHOLDER_DIR = TOP_DIR / "png"
+OPTIMIZED_DIR = TOP_DIR / "optimized"
+# Mirror of the manifest imported by capture_clipboard_shotlist.py (see render_realish_module).
+REALISH_MODULE_PATH = ROOT / "scripts" / "_realish_hashes.py"
+
+# Mirrors scripts/optimize_screenshots.mjs defaults (sips -Z 1400, JPEG quality 80).
+OPTIMIZED_MAX_SIDE = 1400
+OPTIMIZED_JPEG_QUALITY = 80
 
 
 @dataclass(frozen=True)
@@ -62,29 +84,386 @@ SHOTS: list[Shot] = [
 ]
 
 
+@functools.cache
+def _default_font() -> ImageFont.ImageFont:
+    """PIL's bundled font, loaded once per process (shared by every size that falls back to it)."""
+    return ImageFont.load_default()
+
+
+# Best-effort: a system UI font if present; resolved once at import, not per load_font() call.
+_FONT_CANDIDATES = [
+    # macOS (common)
+    "/System/Library/Fonts/SFNS.ttf",
+    "/System/Library/Fonts/SFNSDisplay.ttf",
+    "/System/Library/Fonts/SFNSRounded.ttf",
+    "/System/Library/Fonts/Supplemental/Arial.ttf",
+    "/System/Library/Fonts/Supplemental/Helvetica.ttf",
+    # Linux-ish
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+]
+_FONT_PATH = next((p for p in _FONT_CANDIDATES if Path(p).exists()), None)
+
+
+@functools.lru_cache(maxsize=None)
 def load_font(size: int) -> ImageFont.ImageFont:
-    """Best-effort: use a system UI font if present; otherwise fall back."""
-
-    candidates = [
-        # macOS (common)
-        "/System/Library/Fonts/SFNS.ttf",
-        "/System/Library/Fonts/SFNSDisplay.ttf",
-        "/System/Library/Fonts/SFNSRounded.ttf",
-        "/System/Library/Fonts/Supplemental/Arial.ttf",
-        "/System/Library/Fonts/Supplemental/Helvetica.ttf",
-        # Linux-ish
-        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-    ]
-
-    for p in candidates:
+    """_FONT_PATH at the given size; otherwise fall back to PIL's bundled bitmap font."""
+    if _FONT_PATH is not None:
         try:
-            if Path(p).exists():
-                return ImageFont.truetype(p, size=size)
+            return ImageFont.truetype(_FONT_PATH, size=size)
         except Exception:
-            continue
+            pass
+    return _default_font()
+
+
+# Layout sizes (in pixels)
+PAD = 20
+BROWSER_H = 54
+SHEETS_H = 66
+HEADER_H = BROWSER_H + SHEETS_H
+
+# Brand-ish colors
+SHEETS_GREEN = (15, 157, 88, 255)  # Google-ish green
+CHROME_BG = (245, 246, 248, 255)
+CHROME_BORDER = (220, 222, 227, 255)
+
+
+# Toolbar "pill buttons": PILL_COUNT pills of PILL_W x PILL_H (inclusive), PILL_STEP apart.
+PILL_COUNT = 11
+PILL_W = 24
+PILL_H = 14
+PILL_STEP = 34
+
+
+@functools.cache
+def _pill_strip() -> Image.Image:
+    """The whole toolbar pill row: one pill rasterized once, pasted PILL_COUNT times."""
+    pill = Image.new("RGBA", (PILL_W + 1, PILL_H + 1), (0, 0, 0, 0))
+    ImageDraw.Draw(pill).rounded_rectangle(
+        (0, 0, PILL_W, PILL_H),
+        radius=5,
+        fill=(246, 247, 249, 255),
+        outline=(232, 234, 238, 255),
+    )
+    strip = Image.new("RGBA", ((PILL_COUNT - 1) * PILL_STEP + PILL_W + 1, PILL_H + 1), (0, 0, 0, 0))
+    for i in range(PILL_COUNT):
+        strip.paste(pill, (i * PILL_STEP, 0))
+    return strip
+
+
+# Card shadow: a rounded rect blurred once into a small 9-slice sprite (see draw_card_shadow).
+SHADOW_RADIUS = 10
+SHADOW_BLUR = 6
+SHADOW_FILL = (0, 0, 0, 45)
+SHADOW_MARGIN = 4 * SHADOW_BLUR  # comfortably past the blur's reach
+SHADOW_SLICE = 2 * SHADOW_MARGIN + SHADOW_RADIUS  # corner size; beyond it edges are a constant profile
+
+
+@functools.cache
+def _shadow_sprite() -> Image.Image:
+    """Blurred rounded rect just big enough that its corners don't influence the edge midpoints."""
+    size = 2 * SHADOW_SLICE + 1
+    m = SHADOW_MARGIN
+    sprite = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    ImageDraw.Draw(sprite).rounded_rectangle(
+        (m, m, size - 1 - m, size - 1 - m), radius=SHADOW_RADIUS, fill=SHADOW_FILL
+    )
+    return sprite.filter(ImageFilter.GaussianBlur(radius=SHADOW_BLUR))
+
+
+def _composite_clipped(canvas: Image.Image, im: Image.Image, x: int, y: int) -> None:
+    """alpha_composite im at (x, y), clipping whatever falls outside canvas (negative offsets too)."""
+    sx, sy = max(0, -x), max(0, -y)
+    x, y = max(0, x), max(0, y)
+    sw = min(im.width - sx, canvas.width - x)
+    sh = min(im.height - sy, canvas.height - y)
+    if sw > 0 and sh > 0:
+        canvas.alpha_composite(im, (x, y), (sx, sy, sx + sw, sy + sh))
+
+
+def draw_card_shadow(canvas: Image.Image, box: tuple[int, int, int, int]) -> None:
+    """Composite the blurred card shadow for box (inclusive, like ImageDraw) onto canvas.
+
+    Matches drawing the rounded rect on a full-canvas layer and GaussianBlur-ing it (exactly, as
+    long as the box is more than a blur radius or so from the canvas edge), but is assembled from
+    4 sprite corners, 4 stretched 1px edge strips and a solid interior.
+    """
+    k = SHADOW_SLICE
+    sprite = _shadow_sprite()
+    n = sprite.width
+    x0, y0 = box[0] - SHADOW_MARGIN, box[1] - SHADOW_MARGIN
+    tw = box[2] - box[0] + 1 + 2 * SHADOW_MARGIN
+    th = box[3] - box[1] + 1 + 2 * SHADOW_MARGIN
+    mid_w, mid_h = tw - 2 * k, th - 2 * k
+
+    if mid_w <= 0 or mid_h <= 0:
+        # Too small to slice; blur just the shadow's own extent.
+        layer = Image.new("RGBA", (tw, th), (0, 0, 0, 0))
+        ImageDraw.Draw(layer).rounded_rectangle(
+            (SHADOW_MARGIN, SHADOW_MARGIN, tw - 1 - SHADOW_MARGIN, th - 1 - SHADOW_MARGIN),
+            radius=SHADOW_RADIUS,
+            fill=SHADOW_FILL,
+        )
+        _composite_clipped(canvas, layer.filter(ImageFilter.GaussianBlur(radius=SHADOW_BLUR)), x0, y0)
+        return
+
+    right, bottom = x0 + tw - k, y0 + th - k
+    # Corners.
+    _composite_clipped(canvas, sprite.crop((0, 0, k, k)), x0, y0)
+    _composite_clipped(canvas, sprite.crop((n - k, 0, n, k)), right, y0)
+    _composite_clipped(canvas, sprite.crop((0, n - k, k, n)), x0, bottom)
+    _composite_clipped(canvas, sprite.crop((n - k, n - k, n, n)), right, bottom)
+    # Edges: the sprite's middle row/column, stretched along the edge.
+    nearest = Image.Resampling.NEAREST
+    _composite_clipped(canvas, sprite.crop((k, 0, k + 1, k)).resize((mid_w, k), nearest), x0 + k, y0)
+    _composite_clipped(canvas, sprite.crop((k, n - k, k + 1, n)).resize((mid_w, k), nearest), x0 + k, bottom)
+    _composite_clipped(canvas, sprite.crop((0, k, k, k + 1)).resize((k, mid_h), nearest), x0, y0 + k)
+    _composite_clipped(canvas, sprite.crop((n - k, k, n, k + 1)).resize((k, mid_h), nearest), right, y0 + k)
+    # Interior: flat shadow colour.
+    _composite_clipped(canvas, Image.new("RGBA", (mid_w, mid_h), sprite.getpixel((k, k))), x0 + k, y0 + k)
+
+
+def render_chrome_template(w: int, h: int, font_sm: ImageFont.ImageFont) -> Image.Image:
+    """Render everything that is identical across shots of a given content size.
+
+    That is the browser chrome, traffic lights, address bar, Sheets header/icon, toolbar
+    pills and the blurred card shadow/border. Each shot copies this and only draws its own
+    title + content on top.
+    """
+    pad = PAD
+    browser_h = BROWSER_H
+    sheets_h = SHEETS_H
+    out_w = w + pad * 2
+    out_h = h + HEADER_H + pad * 2
+
+    canvas = Image.new("RGBA", (out_w, out_h), (255, 255, 255, 255))
+    draw = ImageDraw.Draw(canvas)
+
+    # --- Top browser chrome (rounded container) ---
+    draw.rounded_rectangle(
+        (pad, pad, pad + w, pad + browser_h),
+        radius=14,
+        fill=CHROME_BG,
+        outline=CHROME_BORDER,
+        width=1,
+    )
+
+    # macOS traffic-light dots
+    dot_y = pad + 18
+    for i, col in enumerate([(255, 95, 86, 255), (255, 189, 46, 255), (39, 201, 63, 255)]):
+        cx = pad + 18 + i * 18
+        draw.ellipse((cx - 6, dot_y - 6, cx + 6, dot_y + 6), fill=col, outline=None)
+
+    # Address bar
+    ab_x0 = pad + 90
+    ab_x1 = pad + w - 18
+    ab_y0 = pad + 12
+    ab_y1 = pad + browser_h - 12
+    draw.rounded_rectangle(
+        (ab_x0, ab_y0, ab_x1, ab_y1),
+        radius=12,
+        fill=(255, 255, 255, 255),
+        outline=(210, 212, 217, 255),
+        width=1,
+    )
+    addr = "docs.google.com/spreadsheets/d/…"
+    draw.text((ab_x0 + 12, ab_y0 + 9), addr, fill=(90, 92, 98, 255), font=font_sm)
+
+    # --- Fake Google Sheets header ---
+    y2 = pad + browser_h
+    draw.rectangle(
+        (pad, y2, pad + w, y2 + sheets_h),
+        fill=(255, 255, 255, 255),
+        outline=(225, 227, 232, 255),
+    )
+
+    # Sheets icon (green doc w/ white grid)
+    icon_x = pad + 18
+    icon_y = y2 + 18
+    draw.rounded_rectangle((icon_x, icon_y, icon_x + 28, icon_y + 28), radius=6, fill=SHEETS_GREEN)
+    # White inner sheet
+    draw.rounded_rectangle(
+        (icon_x + 7, icon_y + 6, icon_x + 22, icon_y + 22),
+        radius=2,
+        fill=(255, 255, 255, 255),
+    )
+    # Tiny grid hint
+    for gx in [icon_x + 12, icon_x + 17]:
+        draw.line((gx, icon_y + 8, gx, icon_y + 20), fill=(220, 220, 220, 255), width=1)
+    for gy in [icon_y + 12, icon_y + 16]:
+        draw.line((icon_x + 9, gy, icon_x + 20, gy), fill=(220, 220, 220, 255), width=1)
+
+    # Subtle toolbar hint line (pill buttons)
+    canvas.alpha_composite(_pill_strip(), (icon_x + 40, y2 + 44))
+
+    # --- Content card shadow + white card border (content is composited on top per shot) ---
+    content_x = pad
+    content_y = pad + HEADER_H
+
+    draw_card_shadow(canvas, (content_x + 2, content_y + 4, content_x + w + 2, content_y + h + 4))
+
+    draw.rounded_rectangle(
+        (content_x - 1, content_y - 1, content_x + w + 1, content_y + h + 1),
+        radius=10,
+        fill=(255, 255, 255, 255),
+        outline=(230, 232, 236, 255),
+        width=1,
+    )
+
+    return canvas
+
+
+@functools.lru_cache(maxsize=None)
+def _chrome_template(w: int, h: int) -> Image.Image:
+    """Per-process cache: chrome is identical for every shot of the same size.
+
+    Flattened to RGB: everything drawn per shot is opaque or pasted through an alpha mask.
+    """
+    return render_chrome_template(w, h, load_font(14)).convert("RGB")
+
+
+@functools.lru_cache(maxsize=None)
+def _scratch_canvas(w: int, h: int) -> Image.Image:
+    """Per-process output buffer for shots of this content size (overwritten by every shot)."""
+    return Image.new("RGB", _chrome_template(w, h).size)
+
+
+@functools.lru_cache(maxsize=None)
+def _watermark_sprite(text: str) -> Image.Image:
+    """Watermark text on its soft background pill, rendered once per text as a small RGBA sprite.
+
+    The text starts at (8, 6); the pill extends 8px/6px beyond it on each side (inclusive box).
+    """
+    font_sm = load_font(14)
+    bbox = ImageDraw.Draw(Image.new("RGBA", (1, 1))).textbbox((0, 0), text, font=font_sm)
+    tw = bbox[2] - bbox[0]
+    th = bbox[3] - bbox[1]
+    sprite = Image.new("RGBA", (tw + 17, th + 13), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(sprite)
+    # Soft background pill for legibility.
+    draw.rounded_rectangle(
+        (0, 0, sprite.width - 1, sprite.height - 1),
+        radius=10,
+        fill=(255, 255, 255, 190),
+        outline=(0, 0, 0, 60),
+    )
+    draw.text((8, 6), text, fill=(0, 0, 0, 160), font=font_sm)
+    return sprite
+
+
+def _render_shot(shot: Shot, watermark_text: str | None, optimize_inline: bool = False) -> tuple[str, int] | None:
+    """Render one shot to TOP_DIR. Returns (blake2b digest, byte size), or None if its input is missing.
+
+    With optimize_inline, also writes OPTIMIZED_DIR/<stem>.jpg from the same in-memory canvas.
+
+    Runs in a worker process, so fonts/templates come from per-process caches. With those warm, a
+    1648x848 shot is ~3ms of composition (template blit, title, paste, watermark blend) against
+    ~18ms PNG decode and ~30ms encode, so there is nothing left worth moving into compiled code.
+    """
+    in_path = PLACEHOLDER_DIR / shot.filename
+    out_path = TOP_DIR / shot.filename
+
+    if not in_path.exists():
+        return None
+
+    font_sm = load_font(14)
+    font_md = load_font(16)
+
+    # Placeholders are normally plain RGB: paste those as-is and only keep alpha when there is one.
+    base = Image.open(in_path)
+    if base.mode in ("RGB", "RGBA"):
+        base.load()
+    else:
+        base = base.convert("RGBA")
+
+    pad = PAD
+    header_h = HEADER_H
+
+    w, h = base.size
+    out_w = w + pad * 2
+    out_h = h + header_h + pad * 2
+
+    # Reuse this process's canvas for the size: pasting the template over it is a plain row copy,
+    # no fresh multi-MB allocation per shot. Shots render one at a time per process.
+    template = _chrome_template(w, h)
+    canvas = _scratch_canvas(w, h)
+    canvas.paste(template)
+    draw = ImageDraw.Draw(canvas)
+
+    # Per-shot title (position matches the icon in render_chrome_template).
+    y2 = pad + BROWSER_H
+    title = f"{shot.sheet_title} — Google Sheets"
+    draw.text((pad + 18 + 40, y2 + 21), title, fill=(25, 25, 28, 255), font=font_md)
+
+    # --- Base image onto the template's card (shadow + border are already there) ---
+    canvas.paste(base, (pad, pad + header_h), base if base.mode == "RGBA" else None)
+
+    # Optional safety watermark: bottom-right, text 10px inside the padding (see _watermark_sprite).
+    if watermark_text:
+        sprite = _watermark_sprite(watermark_text)
+        x0 = out_w - pad - 10 - (sprite.width - 9)
+        y0 = out_h - pad - 10 - (sprite.height - 7)
+        # Alpha-masked paste onto the opaque RGB canvas == alpha_composite, in one C call.
+        canvas.paste(sprite, (x0, y0), sprite)
+
+    # Save PNG. zlib level 1 is several times cheaper than optimize=True and still small for flat
+    # screenshot content; main() crushes the results with oxipng afterwards when it is installed.
+    canvas.save(out_path, format="PNG", compress_level=1)
+
+    if optimize_inline:
+        jpg = canvas.copy()
+        jpg.thumbnail((OPTIMIZED_MAX_SIDE, OPTIMIZED_MAX_SIDE), Image.Resampling.LANCZOS)
+        OPTIMIZED_DIR.mkdir(parents=True, exist_ok=True)
+        jpg.save(
+            OPTIMIZED_DIR / f"{Path(shot.filename).stem}.jpg",
+            format="JPEG",
+            quality=OPTIMIZED_JPEG_QUALITY,
+            optimize=True,
+            progressive=True,
+        )
+
+    # Record hash for later detection (content identity only, so BLAKE2b rather than sha256).
+    digest = check_screenshots.digest(out_path)
+    return digest, out_path.stat().st_size
+
+
+def load_manifest(path: Path) -> dict:
+    """Previous realish-hashes.json, or {} if missing/unreadable."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    return data if isinstance(data, dict) else {}
 
-    # Fallback: PIL's bundled bitmap font
-    return ImageFont.load_default()
+
+def _is_up_to_date(shot: Shot, prev: dict, source_digest: str, optimize_inline: bool) -> bool:
+    """True if the last run rendered this shot from the same placeholder and its output is still in place.
+
+    The caller has already checked that the watermark matches. The output's size must match the
+    manifest too, so a real capture dropped over a mock is never treated as up to date.
+    """
+    name = shot.filename
+    try:
+        if prev["sources"][name] != source_digest or name not in prev["files"]:
+            return False
+        if (TOP_DIR / name).stat().st_size != prev["sizes"][name]:
+            return False
+    except (KeyError, TypeError, OSError):
+        return False
+    return not optimize_inline or (OPTIMIZED_DIR / f"{Path(name).stem}.jpg").exists()
+
+
+def render_realish_module(payload: dict) -> str:
+    """Python mirror of realish-hashes.json so check_screenshots.py and capture_clipboard_shotlist.py
+    can skip the JSON parse."""
+    hashes = ",\n".join(f"    {h!r}" for h in sorted(payload["files"].values()))
+    sizes = "".join(f"    {k!r}: {v},\n" for k, v in sorted(payload["sizes"].items()))
+    return (
+        '"""Generated by scripts/generate_realish_screenshots.py alongside\n'
+        'docs/screenshots/realish-hashes.json. Do not edit by hand."""\n\n'
+        f"ALGO = {payload['algo']!r}\n\n"
+        f"HASHES: frozenset[str] = frozenset({{\n{hashes},\n}})\n\n"
+        f"SIZES: dict[str, int] = {{\n{sizes}}}\n"
+    )
 
 
 def main() -> int:
@@ -94,6 +473,11 @@ def main() -> int:
         action="store_true",
         help="Also run the screenshot optimizer (writes docs/screenshots/optimized/*.jpg)",
     )
+    ap.add_argument(
+        "--optimize-inline",
+        action="store_true",
+        help="Write docs/screenshots/optimized/*.jpg in-process from the rendered images (no node/sips)",
+    )
     ap.add_argument(
         "--watermark",
         action="store_true",
@@ -104,194 +488,112 @@ def main() -> int:
         default=None,
         help="Custom watermark text (implies --watermark)",
     )
+    ap.add_argument(
+        "--no-oxipng",
+        action="store_true",
+        help="Skip the oxipng pass even if oxipng is on PATH",
+    )
+    ap.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-render every shot even if its placeholder and options are unchanged since the last run",
+    )
     args = ap.parse_args()
 
     TOP_DIR.mkdir(parents=True, exist_ok=True)
 
-    font_sm = load_font(14)
-    font_md = load_font(16)
-
     wrote = 0
     missing = 0
 
     # Write a hash manifest so we can later distinguish "real-ish" mocks from
     # true Google Sheets captures.
     out_hashes: dict[str, str] = {}
+    # Byte sizes let checkers rule out a mock with one stat() before hashing.
+    out_sizes: dict[str, int] = {}
+
+    # Placeholder digests, recorded so unchanged shots can be skipped next time.
+    out_sources: dict[str, str] = {}
+
+    watermark_text = args.watermark_text or ("DEMO (generated)" if args.watermark else None)
 
-    # Brand-ish colors
-    sheets_green = (15, 157, 88, 255)  # Google-ish green
-    chrome_bg = (245, 246, 248, 255)
-    chrome_border = (220, 222, 227, 255)
+    manifest_path = TOP_DIR / "realish-hashes.json"
+    prev = {} if args.force else load_manifest(manifest_path)
+    if prev.get("watermark") != watermark_text:
+        prev = {}
 
+    todo: list[Shot] = []
     for shot in SHOTS:
         in_path = PLACEHOLDER_DIR / shot.filename
-        out_path = TOP_DIR / shot.filename
-
         if not in_path.exists():
-            print(f"MISSING: {in_path.relative_to(ROOT)}")
-            missing += 1
+            todo.append(shot)  # reported as MISSING below
             continue
-
-        base = Image.open(in_path).convert("RGBA")
-
-        # Layout sizes (in pixels)
-        pad = 20
-        browser_h = 54
-        sheets_h = 66
-        header_h = browser_h + sheets_h
-
-        w, h = base.size
-        out_w = w + pad * 2
-        out_h = h + header_h + pad * 2
-
-        canvas = Image.new("RGBA", (out_w, out_h), (255, 255, 255, 255))
-        draw = ImageDraw.Draw(canvas)
-
-        # --- Top browser chrome (rounded container) ---
-        draw.rounded_rectangle(
-            (pad, pad, pad + w, pad + browser_h),
-            radius=14,
-            fill=chrome_bg,
-            outline=chrome_border,
-            width=1,
-        )
-
-        # macOS traffic-light dots
-        dot_y = pad + 18
-        for i, col in enumerate([(255, 95, 86, 255), (255, 189, 46, 255), (39, 201, 63, 255)]):
-            cx = pad + 18 + i * 18
-            draw.ellipse((cx - 6, dot_y - 6, cx + 6, dot_y + 6), fill=col, outline=None)
-
-        # Address bar
-        ab_x0 = pad + 90
-        ab_x1 = pad + w - 18
-        ab_y0 = pad + 12
-        ab_y1 = pad + browser_h - 12
-        draw.rounded_rectangle(
-            (ab_x0, ab_y0, ab_x1, ab_y1),
-            radius=12,
-            fill=(255, 255, 255, 255),
-            outline=(210, 212, 217, 255),
-            width=1,
-        )
-        addr = "docs.google.com/spreadsheets/d/…"
-        draw.text((ab_x0 + 12, ab_y0 + 9), addr, fill=(90, 92, 98, 255), font=font_sm)
-
-        # --- Fake Google Sheets header ---
-        y2 = pad + browser_h
-        draw.rectangle(
-            (pad, y2, pad + w, y2 + sheets_h),
-            fill=(255, 255, 255, 255),
-            outline=(225, 227, 232, 255),
-        )
-
-        # Sheets icon (green doc w/ white grid)
-        icon_x = pad + 18
-        icon_y = y2 + 18
-        draw.rounded_rectangle((icon_x, icon_y, icon_x + 28, icon_y + 28), radius=6, fill=sheets_green)
-        # White inner sheet
-        draw.rounded_rectangle(
-            (icon_x + 7, icon_y + 6, icon_x + 22, icon_y + 22),
-            radius=2,
-            fill=(255, 255, 255, 255),
-        )
-        # Tiny grid hint
-        for gx in [icon_x + 12, icon_x + 17]:
-            draw.line((gx, icon_y + 8, gx, icon_y + 20), fill=(220, 220, 220, 255), width=1)
-        for gy in [icon_y + 12, icon_y + 16]:
-            draw.line((icon_x + 9, gy, icon_x + 20, gy), fill=(220, 220, 220, 255), width=1)
-
-        title = f"{shot.sheet_title} — Google Sheets"
-        draw.text((icon_x + 40, y2 + 21), title, fill=(25, 25, 28, 255), font=font_md)
-
-        # Subtle toolbar hint line (pill buttons)
-        tool_y = y2 + 44
-        x_start = icon_x + 40
-        for i in range(11):
-            x0 = x_start + i * 34
-            draw.rounded_rectangle(
-                (x0, tool_y, x0 + 24, tool_y + 14),
-                radius=5,
-                fill=(246, 247, 249, 255),
-                outline=(232, 234, 238, 255),
-            )
-
-        # --- Content card shadow + base image ---
-        content_x = pad
-        content_y = pad + header_h
-
-        # Shadow layer
-        shadow = Image.new("RGBA", canvas.size, (0, 0, 0, 0))
-        sdraw = ImageDraw.Draw(shadow)
-        sdraw.rounded_rectangle(
-            (content_x + 2, content_y + 4, content_x + w + 2, content_y + h + 4),
-            radius=10,
-            fill=(0, 0, 0, 45),
-        )
-        shadow = shadow.filter(ImageFilter.GaussianBlur(radius=6))
-        canvas.alpha_composite(shadow)
-
-        # White card border behind content
-        draw.rounded_rectangle(
-            (content_x - 1, content_y - 1, content_x + w + 1, content_y + h + 1),
-            radius=10,
-            fill=(255, 255, 255, 255),
-            outline=(230, 232, 236, 255),
-            width=1,
-        )
-
-        canvas.alpha_composite(base, (content_x, content_y))
-
-        # Optional safety watermark.
-        watermark_text = args.watermark_text or ("DEMO (generated)" if args.watermark else None)
-        if watermark_text:
-            overlay = Image.new("RGBA", canvas.size, (0, 0, 0, 0))
-            odraw = ImageDraw.Draw(overlay)
-            bbox = odraw.textbbox((0, 0), watermark_text, font=font_sm)
-            tw = bbox[2] - bbox[0]
-            th = bbox[3] - bbox[1]
-            # Bottom-right, inside padding.
-            x = out_w - pad - tw - 10
-            y = out_h - pad - th - 10
-            # Soft background pill for legibility.
-            odraw.rounded_rectangle(
-                (x - 8, y - 6, x + tw + 8, y + th + 6),
-                radius=10,
-                fill=(255, 255, 255, 190),
-                outline=(0, 0, 0, 60),
+        out_sources[shot.filename] = check_screenshots.digest(in_path)
+        if _is_up_to_date(shot, prev, out_sources[shot.filename], args.optimize_inline):
+            out_hashes[shot.filename] = prev["files"][shot.filename]
+            out_sizes[shot.filename] = prev["sizes"][shot.filename]
+            print(f"Unchanged: {(TOP_DIR / shot.filename).relative_to(ROOT)}")
+        else:
+            todo.append(shot)
+
+    # Shots are independent: render/encode them in parallel (PNG deflate dominates per shot).
+    # A single stale shot is rendered in-process; spawning a pool would cost more than it saves.
+    workers = min(len(todo), os.cpu_count() or 1)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            results = list(
+                ex.map(_render_shot, todo, [watermark_text] * len(todo), [args.optimize_inline] * len(todo))
             )
-            odraw.text((x, y), watermark_text, fill=(0, 0, 0, 160), font=font_sm)
-            canvas.alpha_composite(overlay)
-
-        # Save PNG
-        canvas.convert("RGB").save(out_path, format="PNG", optimize=True)
-
-        # Record hash for later detection.
-        h = hashlib.sha256(out_path.read_bytes()).hexdigest()
-        out_hashes[shot.filename] = h
+    else:
+        results = [_render_shot(shot, watermark_text, args.optimize_inline) for shot in todo]
 
+    for shot, result in zip(todo, results):
+        if result is None:
+            print(f"MISSING: {(PLACEHOLDER_DIR / shot.filename).relative_to(ROOT)}")
+            missing += 1
+            continue
+        out_hashes[shot.filename], out_sizes[shot.filename] = result
         wrote += 1
-        print(f"Wrote: {out_path.relative_to(ROOT)}")
+        print(f"Wrote: {(TOP_DIR / shot.filename).relative_to(ROOT)}")
 
     if missing:
         print(f"\nDone (with missing inputs). wrote={wrote}, missing={missing}")
         return 2
 
+    # Pillow only did a fast level-1 deflate; let oxipng (multithreaded, better filter choice)
+    # crush everything we just wrote, then re-record what is actually on disk.
+    rendered = [TOP_DIR / shot.filename for shot in todo]
+    oxipng = shutil.which("oxipng")
+    if rendered and oxipng and not args.no_oxipng:
+        try:
+            subprocess.run([oxipng, "-q", "-o", "2", "--strip", "safe", *map(str, rendered)], check=True)
+        except subprocess.CalledProcessError as e:
+            print(f"[oxipng] Failed (exit={e.returncode}); keeping the level-1 PNGs")
+        for out_path in rendered:
+            out_hashes[out_path.name] = check_screenshots.digest(out_path)
+            out_sizes[out_path.name] = out_path.stat().st_size
+
     # Persist a manifest of the generated hashes so check_screenshots.py can
-    # warn/fail if a listing accidentally uses mocks.
-    try:
-        manifest_path = TOP_DIR / "realish-hashes.json"
-        payload = {
-            "kind": "realish-hashes",
-            "generatedAt": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
-            "files": out_hashes,
-        }
-        manifest_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
-        print(f"Wrote: {manifest_path.relative_to(ROOT)}")
-    except Exception as e:
-        print(f"WARN: failed to write realish-hashes.json: {e}")
-
-    if args.optimize:
+    # warn/fail if a listing accidentally uses mocks. If nothing was re-rendered, leave it
+    # (and its timestamp) alone.
+    if wrote or not prev:
+        try:
+            payload = {
+                "kind": "realish-hashes",
+                "generatedAt": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+                "algo": check_screenshots.DIGEST_ALGO,
+                "files": {shot.filename: out_hashes[shot.filename] for shot in SHOTS},
+                "sizes": {shot.filename: out_sizes[shot.filename] for shot in SHOTS},
+                "sources": {shot.filename: out_sources[shot.filename] for shot in SHOTS},
+                "watermark": watermark_text,
+            }
+            manifest_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+            print(f"Wrote: {manifest_path.relative_to(ROOT)}")
+            REALISH_MODULE_PATH.write_text(render_realish_module(payload), encoding="utf-8")
+            print(f"Wrote: {REALISH_MODULE_PATH.relative_to(ROOT)}")
+        except Exception as e:
+            print(f"WARN: failed to write realish-hashes.json: {e}")
+
+    if args.optimize and not args.optimize_inline:
         try:
             # Best-effort convenience.
             subprocess.run(["node", "scripts/optimize_screenshots.mjs"], cwd=ROOT, check=True)
@@ -302,7 +604,7 @@ def main() -> int:
                 f"[optimize] Failed (exit={e.returncode}). You can rerun manually: node scripts/optimize_screenshots.mjs"
             )
 
-    print(f"\nDone. wrote={wrote}")
+    print(f"\nDone. wrote={wrote}, unchanged={len(SHOTS) - wrote}")
     return 0
 
 
@@ -27,6 +27,9 @@ Options:
   --guided              Step through the shotlist and wait for a *new* capture each step.
   --timeout-seconds     Per-shot timeout for --watch/--guided (default: 600)
   --poll-ms             Poll interval for --watch/--guided (default: 750)
+  --poll-schedule       adaptive (default): poll less while framing/idle; fixed: always --poll-ms
+                        (If the optional `watchdog` package is installed, --watch/--guided wait on
+                        FSEvents/inotify instead of polling.)
   --open               When selecting a candidate, open it in Preview (macOS `open`).
   --open-reference      In --guided/--watch mode, open the current canonical screenshot as a framing reference.
                         (Defaults ON for --guided.)
@@ -48,17 +51,25 @@ Defaults:
 from __future__ import annotations
 
 import argparse
-import glob
+import errno
+import fnmatch
+import functools
 import os
+import re
 import shutil
 import subprocess
 import sys
+import threading
 import time
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+from typing import Callable
 
 
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEST_DIR = REPO_ROOT / "docs" / "screenshots"
+
 TARGETS = [
     ("01-menu.png", "01 — Custom menu visible (Approvals menu open)"),
     ("02-requests-pending.png", "02 — Requests sheet showing PENDING rows"),
@@ -75,7 +86,7 @@ TARGETS = [
 @dataclass(frozen=True)
 class Candidate:
     path: Path
-    mtime: float
+    mtime_ns: int
     size: int
 
 
@@ -93,7 +104,7 @@ def pick_auto_src_dir(patterns: list[str]) -> Path:
     """
 
     candidates_dirs = [expand("~/Desktop"), expand("~/Downloads")]
-    newest: tuple[float, Path] | None = None
+    newest: tuple[int, Path] | None = None
 
     for d in candidates_dirs:
         if not d.exists() or not d.is_dir():
@@ -102,8 +113,8 @@ def pick_auto_src_dir(patterns: list[str]) -> Path:
         if not hits:
             continue
         top = hits[0]
-        if newest is None or top.mtime > newest[0]:
-            newest = (top.mtime, d)
+        if newest is None or top.mtime_ns > newest[0]:
+            newest = (top.mtime_ns, d)
 
     if newest is None:
         raise FileNotFoundError(
@@ -114,31 +125,79 @@ def pick_auto_src_dir(patterns: list[str]) -> Path:
     return newest[1]
 
 
+@functools.lru_cache(maxsize=None)
+def _compile_patterns(patterns: tuple[str, ...]) -> tuple[Callable[[str], object], bool]:
+    """(name matcher, allow_dotfiles) for a pattern set, built once and reused by every poll.
+
+    All globs are folded into one alternation regex, case-sensitive like glob on POSIX
+    (fnmatchcase semantics, no normcase per name).
+    """
+    rx = re.compile("|".join(fnmatch.translate(pat) for pat in patterns) or "(?!)")
+    return rx.match, any(pat.startswith(".") for pat in patterns)
+
+
 def find_candidates(src_dir: Path, patterns: list[str]) -> list[Candidate]:
-    hits: list[Candidate] = []
-    for pat in patterns:
-        for s in glob.glob(str(src_dir / pat)):
-            p = Path(s)
+    """Files in src_dir matching any of patterns, newest first.
+
+    One scandir pass for all patterns (keyed by path, so overlapping patterns don't duplicate);
+    like glob, a leading "*" does not match dotfiles. DirEntry answers is_file() from the
+    directory listing, so each match costs a single stat().
+    """
+    match, allow_dotfiles = _compile_patterns(tuple(patterns))
+    hits: dict[str, Candidate] = {}
+    try:
+        it = os.scandir(src_dir)
+    except FileNotFoundError:
+        return []
+    with it:
+        for de in it:
+            if de.name.startswith(".") and not allow_dotfiles:
+                continue
+            if not match(de.name):
+                continue
             try:
-                st = p.stat()
+                if not de.is_file():
+                    continue
+                st = de.stat()
             except FileNotFoundError:
                 continue
-            if not p.is_file():
-                continue
-            hits.append(Candidate(path=p, mtime=st.st_mtime, size=st.st_size))
+            hits[de.path] = Candidate(path=Path(de.path), mtime_ns=st.st_mtime_ns, size=st.st_size)
 
     # newest first
-    hits.sort(key=lambda c: c.mtime, reverse=True)
+    return sorted(hits.values(), key=lambda c: c.mtime_ns, reverse=True)
 
-    # de-dupe exact paths
-    seen: set[Path] = set()
-    out: list[Candidate] = []
-    for c in hits:
-        if c.path in seen:
-            continue
-        seen.add(c.path)
-        out.append(c)
-    return out
+
+def _fast_copy(src: Path, dst: Path) -> None:
+    """Copy src to dst as cheaply as the platform allows.
+
+    macOS: `cp -c` (clonefile(2); an O(1) APFS clone when Desktop and repo share a volume).
+    Linux: copy_file_range (in-kernel; a reflink on btrfs/xfs).
+    Otherwise, or when those refuse (e.g. across volumes/filesystems): shutil.copyfile.
+    The destination gets a fresh mtime, which check_screenshots.py's hash cache relies on.
+    """
+    if sys.platform == "darwin":
+        try:
+            r = subprocess.run(["cp", "-c", str(src), str(dst)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            if r.returncode == 0:
+                os.utime(dst)  # clonefile may carry over the capture's timestamps
+                return
+        except OSError:
+            pass
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if n == 0:
+                        break
+                    remaining -= n
+                else:
+                    return
+        except OSError as e:
+            if e.errno not in (errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM):
+                raise
+    shutil.copyfile(src, dst)
 
 
 def fmt_bytes(n: int) -> str:
@@ -150,11 +209,24 @@ def fmt_bytes(n: int) -> str:
     return f"{size:.0f}B"
 
 
-def fmt_mtime(ts: float) -> str:
+def fmt_mtime(ts_ns: int) -> str:
+    try:
+        return datetime.fromtimestamp(ts_ns / 1e9).strftime("%Y-%m-%d %H:%M")
+    except Exception:
+        return str(ts_ns)
+
+
+def open_file(p: Path) -> None:
+    """Best-effort macOS `open` (Preview etc.), fire-and-forget so prompts aren't held up."""
     try:
-        return datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M")
+        subprocess.Popen(
+            ["open", str(p)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True,
+        )
     except Exception:
-        return str(ts)
+        pass
 
 
 def prompt(msg: str) -> str:
@@ -165,29 +237,134 @@ def prompt(msg: str) -> str:
         raise SystemExit(130)
 
 
+def _scan_for_new(
+    src_dir: Path, patterns: list[str], seen_paths: set[Path], since_ns: int, min_bytes: int
+) -> Path | None:
+    """The newest matching file not in seen_paths with mtime_ns >= since_ns and size >= min_bytes.
+
+    Poll-loop variant of find_candidates: entries that aren't new are rejected on name/path alone
+    (no stat), and nothing is collected or sorted, so the usual "nothing new yet" poll is cheap.
+    """
+    match, allow_dotfiles = _compile_patterns(tuple(patterns))
+    best: tuple[int, Path] | None = None
+    try:
+        it = os.scandir(src_dir)
+    except FileNotFoundError:
+        return None
+    with it:
+        for de in it:
+            if de.name.startswith(".") and not allow_dotfiles:
+                continue
+            if not match(de.name):
+                continue
+            p = Path(de.path)
+            # In watch/guided mode we want *new* files, but allow brand new names even if timestamps jitter.
+            if p in seen_paths:
+                continue
+            try:
+                if not de.is_file():
+                    continue
+                st = de.stat()
+            except FileNotFoundError:
+                continue
+            if st.st_mtime_ns < since_ns or st.st_size < min_bytes:
+                continue
+            if best is None or st.st_mtime_ns > best[0]:
+                best = (st.st_mtime_ns, p)
+    return None if best is None else best[1]
+
+
+# With watchdog, still rescan this often in case an event is missed.
+WATCH_SAFETY_POLL_SECONDS = 5.0
+
+
+class _DirChanged(threading.Event):
+    """Set by a watchdog observer on any change in the watched directory."""
+
+    def __init__(self, observer) -> None:
+        super().__init__()
+        self._observer = observer
+
+    def stop(self) -> None:
+        self._observer.stop()
+        self._observer.join(timeout=2)
+
+
+def _watch_dir(src_dir: Path) -> _DirChanged | None:
+    """Start an FSEvents/inotify watch on src_dir if the optional `watchdog` package is installed.
+
+    Any event (create, modify, and the rename macOS uses to publish a finished capture) just
+    wakes the waiter, which rescans with _scan_for_new. Returns None to fall back to polling.
+    """
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        return None
+
+    observer = Observer()
+    changed = _DirChanged(observer)
+
+    class _Handler(FileSystemEventHandler):
+        def on_any_event(self, event) -> None:
+            changed.set()
+
+    try:
+        observer.schedule(_Handler(), str(src_dir), recursive=False)
+        observer.start()
+    except Exception:
+        return None
+    return changed
+
+
+def next_poll_delay(elapsed: float, poll: float) -> float:
+    """Adaptive poll schedule (seconds): sparse while the shot is still being framed, --poll-ms
+    while a capture is likely, then backing off once the step has sat idle for 30s."""
+    if elapsed < 2.0:
+        return max(poll, 1.5)
+    if elapsed < 30.0:
+        return poll
+    return max(poll, min(3.0, poll * 2))
+
+
 def wait_for_new_capture(
     *,
     src_dir: Path,
     patterns: list[str],
     seen_paths: set[Path],
-    since_ts: float,
+    since_ns: int,
     timeout_seconds: int,
     poll_ms: int,
     min_bytes: int,
+    poll_schedule: str = "fixed",
+    initial_entries: list[Candidate] | None = None,
 ) -> Path:
-    deadline = time.time() + timeout_seconds
-    while time.time() < deadline:
-        candidates = find_candidates(src_dir, patterns)
-        for c in candidates:
-            # In watch/guided mode we want *new* files, but allow brand new names even if timestamps jitter.
-            if c.path in seen_paths:
-                continue
-            if c.mtime < since_ts:
-                continue
-            if c.size < min_bytes:
+    """Wait for a new capture. initial_entries is a scan the caller just made (and folded into
+    seen_paths); it stands in for the first scan, so the directory is only re-read after a wait."""
+    start = time.time()
+    deadline = start + timeout_seconds
+    changed = _watch_dir(src_dir)
+    try:
+        while time.time() < deadline:
+            if initial_entries is not None:
+                # Nothing in a fresh seed scan is new; skip straight to waiting.
+                initial_entries = None
+            else:
+                p = _scan_for_new(src_dir, patterns, seen_paths, since_ns, min_bytes)
+                if p is not None:
+                    return p
+            if changed is not None:
+                # Event-driven: rescan when the directory changes (the timeout is only a safety net).
+                changed.wait(timeout=max(0.0, min(WATCH_SAFETY_POLL_SECONDS, deadline - time.time())))
+                changed.clear()
                 continue
-            return c.path
-        time.sleep(max(0.1, poll_ms / 1000.0))
+            delay = poll_ms / 1000.0
+            if poll_schedule == "adaptive":
+                delay = next_poll_delay(time.time() - start, delay)
+            time.sleep(max(0.1, delay))
+    finally:
+        if changed is not None:
+            changed.stop()
 
     raise TimeoutError(
         f"Timed out after {timeout_seconds}s waiting for a new screenshot capture in {src_dir}"
@@ -206,7 +383,7 @@ def main() -> int:
         "--glob",
         dest="globs",
         action="append",
-        help="Glob pattern (relative to --from). Repeatable.",
+        help="Filename glob pattern matched in --from (not recursive). Repeatable.",
     )
     ap.add_argument("--include-jpg", action="store_true", help="Also include Screenshot*.jpg/jpeg")
 
@@ -232,6 +409,13 @@ def main() -> int:
         default=750,
         help="Poll interval for --watch/--guided (default: 750).",
     )
+    ap.add_argument(
+        "--poll-schedule",
+        choices=["adaptive", "fixed"],
+        default="adaptive",
+        help="adaptive: poll every 1.5s for the first 2s of a step, --poll-ms until 30s, then up to "
+        "2x --poll-ms (max 3s). fixed: always --poll-ms (default: adaptive).",
+    )
 
     ap.add_argument(
         "--since-minutes",
@@ -276,17 +460,6 @@ def main() -> int:
         print("--watch/--guided and --non-interactive are mutually exclusive", file=sys.stderr)
         return 2
 
-    patterns = args.globs or ["Screenshot*.png", "Screen Shot*.png"]
-    if args.include_jpg:
-        patterns += ["Screenshot*.jpg", "Screenshot*.jpeg", "Screen Shot*.jpg", "Screen Shot*.jpeg"]
-
-    src_dir = expand(args.src)
-    if str(args.src).strip().upper() == "AUTO":
-        src_dir = pick_auto_src_dir(patterns)
-    if not src_dir.exists():
-        print(f"Source dir does not exist: {src_dir}", file=sys.stderr)
-        return 2
-
     base_globs = args.globs or ["Screenshot*.png", "Screen Shot*.png"]
 
     patterns: list[str] = []
@@ -298,11 +471,19 @@ def main() -> int:
             else:
                 patterns += [g + ".jpg", g + ".jpeg"]
 
-    candidates = find_candidates(src_dir, patterns)
+    src_dir = expand(args.src)
+    if str(args.src).strip().upper() == "AUTO":
+        src_dir = pick_auto_src_dir(patterns)
+    if not src_dir.exists():
+        print(f"Source dir does not exist: {src_dir}", file=sys.stderr)
+        return 2
+
+    scanned = find_candidates(src_dir, patterns)
+    candidates = scanned
 
     if args.since_minutes is not None:
-        cutoff = datetime.now().timestamp() - (args.since_minutes * 60)
-        candidates = [c for c in candidates if c.mtime >= cutoff]
+        cutoff_ns = time.time_ns() - args.since_minutes * 60 * 1_000_000_000
+        candidates = [c for c in candidates if c.mtime_ns >= cutoff_ns]
 
     if args.min_bytes is not None:
         candidates = [c for c in candidates if c.size >= args.min_bytes]
@@ -312,23 +493,18 @@ def main() -> int:
         print(f"No candidates found in {src_dir} matching {patterns}{note}", file=sys.stderr)
         return 1
 
-    dest_dir = Path(__file__).resolve().parent.parent / "docs" / "screenshots"
-    dest_dir.mkdir(parents=True, exist_ok=True)
+    DEST_DIR.mkdir(parents=True, exist_ok=True)
 
     if args.open_guides:
         # Best-effort macOS convenience: open the docs you’ll want while capturing.
-        repo_root = Path(__file__).resolve().parent.parent
         guide_paths = [
-            repo_root / "docs" / "screenshots" / "REAL_SCREENSHOTS_QUICKRUN.md",
-            repo_root / "docs" / "screenshots" / "REAL_SCREENSHOTS_SHOTLIST.md",
-            repo_root / "docs" / "screenshots" / "CAPTURE-CHEATSHEET.md",
+            DEST_DIR / "REAL_SCREENSHOTS_QUICKRUN.md",
+            DEST_DIR / "REAL_SCREENSHOTS_SHOTLIST.md",
+            DEST_DIR / "CAPTURE-CHEATSHEET.md",
         ]
         for gp in guide_paths:
             if gp.exists():
-                try:
-                    subprocess.run(["open", str(gp)], check=False)
-                except Exception:
-                    pass
+                open_file(gp)
 
     if args.guided or args.watch:
         # Default: in guided mode, opening a reference image is usually helpful.
@@ -345,19 +521,18 @@ def main() -> int:
         print("Tip: for each step, take a screenshot (Cmd+Shift+4) and wait for it to appear.")
         print("")
 
-        # Establish baseline "seen" set so we only accept new captures.
-        seen_paths = {c.path for c in find_candidates(src_dir, patterns)}
-        since_ts = time.time() - 2.0
+        # Establish baseline "seen" set so we only accept new captures. Reuses the startup scan,
+        # which also stands in for the first shot's initial rescan.
+        initial: list[Candidate] | None = scanned
+        seen_paths = {c.path for c in initial}
+        since_ns = time.time_ns() - 2_000_000_000
 
         planned: list[tuple[Path, Path, str]] = []
         for (target_fname, desc) in TARGETS:
             if args.open_reference:
-                ref = dest_dir / target_fname
+                ref = DEST_DIR / target_fname
                 if ref.exists():
-                    try:
-                        subprocess.run(["open", str(ref)], check=False)
-                    except Exception:
-                        pass
+                    open_file(ref)
 
             if args.guided:
                 prompt(
@@ -370,28 +545,30 @@ def main() -> int:
                     src_dir=src_dir,
                     patterns=patterns,
                     seen_paths=seen_paths,
-                    since_ts=since_ts,
+                    since_ns=since_ns,
                     timeout_seconds=args.timeout_seconds,
                     poll_ms=args.poll_ms,
+                    poll_schedule=args.poll_schedule,
                     min_bytes=args.min_bytes,
+                    initial_entries=initial,
                 )
             except TimeoutError as e:
                 print(str(e), file=sys.stderr)
                 return 1
 
+            initial = None
             seen_paths.add(p)
             try:
-                since_ts = max(since_ts, p.stat().st_mtime)
+                since_ns = max(since_ns, p.stat().st_mtime_ns)
             except Exception:
-                since_ts = time.time()
+                since_ns = time.time_ns()
 
-            planned.append((p, dest_dir / target_fname, desc))
+            planned.append((p, DEST_DIR / target_fname, desc))
             print(f"  Found: {p.name} -> {target_fname}")
 
         print("\nPlanned actions:")
-        repo_root = Path(__file__).resolve().parent.parent
         for src_path, dest_path, desc in planned:
-            print(f"  - COPY {src_path.name} -> {dest_path.relative_to(repo_root)} ({desc})")
+            print(f"  - COPY {src_path.name} -> {dest_path.relative_to(REPO_ROOT)} ({desc})")
 
         if args.dry_run:
             print("\nDry run; no files copied.")
@@ -404,7 +581,7 @@ def main() -> int:
                 return 0
 
         for src_path, dest_path, _desc in planned:
-            shutil.copy2(src_path, dest_path)
+            _fast_copy(src_path, dest_path)
 
         print("\nDone. Copied all screenshots.")
 
@@ -413,7 +590,7 @@ def main() -> int:
         if args.since_minutes is not None:
             print(f"  (filtered to last {args.since_minutes} minutes)")
         for i, c in enumerate(candidates[:20], start=1):
-            print(f"  [{i:2d}] {c.path.name}  ({fmt_mtime(c.mtime)} · {fmt_bytes(c.size)})")
+            print(f"  [{i:2d}] {c.path.name}  ({fmt_mtime(c.mtime_ns)} · {fmt_bytes(c.size)})")
         if len(candidates) > 20:
             print(f"  ... and {len(candidates) - 20} more")
         print("")
@@ -456,10 +633,7 @@ def main() -> int:
                     continue
                 p = candidates[idx - 1].path
                 if args.open:
-                    try:
-                        subprocess.run(["open", str(p)], check=False)
-                    except Exception:
-                        pass
+                    open_file(p)
                 chosen.append(p)
 
         # execute
@@ -467,17 +641,15 @@ def main() -> int:
         actions: list[tuple[Path | None, Path, str]] = []
         for (target_fname, desc), src_path in zip(TARGETS, chosen):
             if src_path is None:
-                actions.append((None, dest_dir / target_fname, desc))
+                actions.append((None, DEST_DIR / target_fname, desc))
             else:
-                actions.append((Path(src_path), dest_dir / target_fname, desc))
-
-        repo_root = Path(__file__).resolve().parent.parent
+                actions.append((Path(src_path), DEST_DIR / target_fname, desc))
 
         for src_path, dest_path, desc in actions:
             if src_path is None:
                 print(f"  - SKIP {dest_path.name} ({desc})")
             else:
-                print(f"  - COPY {src_path.name} -> {dest_path.relative_to(repo_root)} ({desc})")
+                print(f"  - COPY {src_path.name} -> {dest_path.relative_to(REPO_ROOT)} ({desc})")
 
         if args.dry_run:
             print("\nDry run; no files copied.")
@@ -493,22 +665,26 @@ def main() -> int:
         for src_path, dest_path, _desc in actions:
             if src_path is None:
                 continue
-            shutil.copy2(src_path, dest_path)
+            _fast_copy(src_path, dest_path)
             copied += 1
 
         print(f"\nDone. Copied {copied} file(s).")
 
-    repo_root = Path(__file__).resolve().parent.parent
-
     if args.check:
-        print("\n[screenshots] Running check_screenshots.py …")
-        subprocess.run([sys.executable, str(repo_root / "scripts" / "check_screenshots.py")], check=False)
+        print("\n[screenshots] Running check_screenshots.py …", flush=True)
+        # In-process (scripts/ is on sys.path when this runs as a script); its exit code is advisory here.
+        import check_screenshots
+
+        try:
+            check_screenshots.main([])
+        except SystemExit:
+            pass
 
     if args.optimize:
         print("\n[screenshots] Running optimize_screenshots.mjs …")
         subprocess.run(
-            ["node", str(repo_root / "scripts" / "optimize_screenshots.mjs")],
-            cwd=str(repo_root),
+            ["node", str(REPO_ROOT / "scripts" / "optimize_screenshots.mjs")],
+            cwd=str(REPO_ROOT),
             check=False,
         )
 
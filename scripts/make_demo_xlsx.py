@@ -12,45 +12,95 @@ from __future__ import annotations
 
 from pathlib import Path
 import csv
+import functools
+from dataclasses import dataclass
 from datetime import datetime
+from typing import TYPE_CHECKING
 
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment
+# openpyxl (and its styles graph) is imported lazily, on first use, not at module load.
+if TYPE_CHECKING:
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment, Font, PatternFill
 
 ROOT = Path(__file__).resolve().parents[1]
 DEMO_DIR = ROOT / "demo"
 OUT_PATH = DEMO_DIR / "Sheets-Approvals-Demo.xlsx"
 
 
-def read_csv(path: Path) -> list[list[str]]:
-    rows: list[list[str]] = []
-    with path.open("r", newline="", encoding="utf-8") as f:
-        for row in csv.reader(f):
-            rows.append(row)
-    return rows
+def column_widths(rows: list[list[str]], max_width: int = 60, min_width: int = 10) -> list[int]:
+    """Column widths fitting the longest raw CSV value per column (clamped to [min_width, max_width])."""
+    lens: list[int] = []
+    for row in rows:
+        if len(row) > len(lens):
+            lens.extend([0] * (len(row) - len(lens)))
+        for i, v in enumerate(row):
+            if len(v) > lens[i]:
+                lens[i] = len(v)
+    return [max(min_width, min(max_width, n + 2)) for n in lens]
+
+
+@dataclass(frozen=True)
+class _Styles:
+    header_fill: PatternFill
+    header_font: Font
+    header_align: Alignment
+    title_font: Font
+
+
+@functools.cache
+def _get_styles() -> _Styles:
+    """Shared cell styles, built once per process."""
+    from openpyxl.styles import Alignment, Font, PatternFill
+
+    return _Styles(
+        header_fill=PatternFill("solid", fgColor="1F2937"),  # slate-800
+        header_font=Font(color="FFFFFF", bold=True),
+        header_align=Alignment(vertical="center"),
+        title_font=Font(bold=True, size=14),
+    )
+
 
+def header_cells(ws, row: list[str]) -> list[WriteOnlyCell]:
+    from openpyxl.cell import WriteOnlyCell
 
-def style_header_row(ws, header_row: int = 1):
-    header_fill = PatternFill("solid", fgColor="1F2937")  # slate-800
-    header_font = Font(color="FFFFFF", bold=True)
-    for cell in ws[header_row]:
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = Alignment(vertical="center")
+    styles = _get_styles()
+    cells = []
+    for v in row:
+        cell = WriteOnlyCell(ws, value=v)
+        cell.fill = styles.header_fill
+        cell.font = styles.header_font
+        cell.alignment = styles.header_align
+        cells.append(cell)
+    return cells
 
 
-def autosize_columns(ws, max_width: int = 60, min_width: int = 10):
-    for col in ws.columns:
-        max_len = 0
-        col_letter = col[0].column_letter
-        for c in col:
-            v = "" if c.value is None else str(c.value)
-            max_len = max(max_len, len(v))
-        ws.column_dimensions[col_letter].width = max(min_width, min(max_width, max_len + 2))
+def write_csv_sheet(wb: Workbook, title: str, path: Path) -> None:
+    """Write a CSV into a new write-only sheet: styled header row, frozen below it, autosized columns.
+
+    Write-only sheets emit column widths before the first row, so the CSV is read once into a list
+    and the widths are taken from its raw strings before any row is appended.
+    """
+    from openpyxl.utils import get_column_letter
+
+    with path.open("r", newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    ws = wb.create_sheet(title)
+    for i, width in enumerate(column_widths(rows), start=1):
+        ws.column_dimensions[get_column_letter(i)].width = width
+    ws.freeze_panes = "A2"
+    if rows:
+        ws.append(header_cells(ws, rows[0]))
+    for row in rows[1:]:
+        ws.append(row)
 
 
 def main() -> None:
-    wb = Workbook()
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+
+    # write_only: rows are serialized as they're appended instead of held as Cell objects.
+    wb = Workbook(write_only=True)
 
     # Make output reproducible: Excel metadata timestamps can otherwise change on each run.
     fixed_dt = datetime(2000, 1, 1, 0, 0, 0)
@@ -59,28 +109,16 @@ def main() -> None:
     wb.properties.creator = "sheets-approval-appsscript"
     wb.properties.lastModifiedBy = "sheets-approval-appsscript"
 
-    # Requests
-    ws_req = wb.active
-    ws_req.title = "Requests"
-    req_rows = read_csv(DEMO_DIR / "Requests.csv")
-    for r in req_rows:
-        ws_req.append(r)
-    style_header_row(ws_req, 1)
-    ws_req.freeze_panes = "A2"
-    autosize_columns(ws_req)
-
-    # Audit
-    ws_audit = wb.create_sheet("Audit")
-    audit_rows = read_csv(DEMO_DIR / "Audit.csv")
-    for r in audit_rows:
-        ws_audit.append(r)
-    style_header_row(ws_audit, 1)
-    ws_audit.freeze_panes = "A2"
-    autosize_columns(ws_audit)
+    # Requests + Audit
+    write_csv_sheet(wb, "Requests", DEMO_DIR / "Requests.csv")
+    write_csv_sheet(wb, "Audit", DEMO_DIR / "Audit.csv")
 
     # README tab for humans
     ws_readme = wb.create_sheet("README")
-    ws_readme.append(["Sheets Approvals + Audit Trail — Demo Workbook"])
+    ws_readme.column_dimensions["A"].width = 100
+    title = WriteOnlyCell(ws_readme, value="Sheets Approvals + Audit Trail — Demo Workbook")
+    title.font = _get_styles().title_font
+    ws_readme.append([title])
     ws_readme.append([""])
     ws_readme.append([
         "1) Upload this .xlsx to Google Drive and open it as a Google Sheet."])
@@ -91,8 +129,6 @@ def main() -> None:
     ws_readme.append([""])
     ws_readme.append([
         "Repo: https://github.com/tyclaudius-ai/sheets-approval-appsscript"])
-    ws_readme["A1"].font = Font(bold=True, size=14)
-    ws_readme.column_dimensions["A"].width = 100
 
     OUT_PATH.parent.mkdir(parents=True, exist_ok=True)
     wb.save(OUT_PATH)
@@ -14,33 +14,176 @@ Usage:
   python3 scripts/make_marketplace_pack.py --out dist/marketplace-pack.zip
   # enforce only true screenshots (fails on placeholders + known real-ish mocks)
   python3 scripts/make_marketplace_pack.py --require-real-screenshots
+  # rebuild even if no inputs changed since the last pack
+  python3 scripts/make_marketplace_pack.py --force
 
 Outputs:
   dist/marketplace-pack-<timestamp>.zip (default)
+  dist/.marketplace-pack.manifest.json (input digests; an unchanged rerun reuses the last pack)
 """
 
 from __future__ import annotations
 
 import argparse
+import contextlib
 import datetime as dt
+import importlib
+import io
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import subprocess
+import sys
 import zipfile
 import shutil
 
+# scripts/ is on sys.path when this runs as a script.
+from _zip_util import compress_type
 
 ROOT = Path(__file__).resolve().parents[1]
 DIST = ROOT / "dist"
-
-
-def _run(cmd: list[str]) -> None:
-    subprocess.check_call(cmd, cwd=ROOT)
-
-
-def _run_json(cmd: list[str]) -> dict:
-    out = subprocess.check_output(cmd, cwd=ROOT)
-    return json.loads(out.decode("utf-8"))
+MANIFEST_PATH = DIST / ".marketplace-pack.manifest.json"
+
+INCLUDE_FILES = [
+    # top-level navigation / quickstart
+    "START_HERE.md",
+    "README.md",
+    "QUICKSTART.md",
+    "SETUP-CHECKLIST.md",
+    "TROUBLESHOOTING.md",
+    "UNINSTALL.md",
+    "TEMPLATE-INSTRUCTIONS.md",
+    "CHANGELOG.md",
+
+    # product + delivery docs
+    "CLIENT-HANDOFF.md",
+    "ONE_PAGER.md",
+    "DEMO.md",
+    "DEMO-WALKTHROUGH.md",
+    "DEMO-TEMPLATE.md",
+
+    # screenshots
+    "SCREENSHOTS.md",
+    "REAL_SCREENSHOTS_GUIDE.md",
+
+    # marketplace / sales assets
+    "LISTING.md",
+    "MARKETPLACE-LISTING-COPY.md",
+    "MARKETPLACE-CHECKLIST.md",
+    "SALES.md",
+    "OUTREACH-TEMPLATES.md",
+    "INTAKE_QUESTIONS.md",
+]
+
+# Copied whole into the pack (and read by the bundle/screenshot-pack builders).
+INCLUDE_DIRS = ["landing", "docs/screenshots"]
+
+
+def _call_main(module: str, argv: list[str]) -> int:
+    """Run scripts/<module>.py's main(argv) in this interpreter instead of spawning python3.
+
+    SystemExit from the script is turned into its exit code (messages go to stderr, like the CLI).
+    argv paths must not depend on the working directory (see _in_root).
+    """
+    try:
+        rc = importlib.import_module(module).main(argv)
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        print(e.code, file=sys.stderr)
+        return 1
+    return rc or 0
+
+
+@contextlib.contextmanager
+def _in_root():
+    """Temporarily chdir to ROOT (for scripts whose relative args/report text assume it)."""
+    prev = os.getcwd()
+    os.chdir(ROOT)
+    try:
+        yield
+    finally:
+        os.chdir(prev)
+
+
+def _call_parallel(calls: list[tuple[str, list[str]]]) -> None:
+    """Run independent script mains concurrently (threads: their zlib work releases the GIL)."""
+    with ThreadPoolExecutor(max_workers=len(calls)) as ex:
+        rcs = list(ex.map(lambda c: _call_main(*c), calls))
+    for (module, argv), rc in zip(calls, rcs):
+        if rc != 0:
+            raise SystemExit(f"{module}.py {' '.join(argv)} failed (exit={rc})")
+
+
+def _call_json(module: str, argv: list[str]) -> tuple[dict, int]:
+    """Run a script main from ROOT, parsing what it prints as JSON; returns (payload, exit code)."""
+    buf = io.StringIO()
+    with _in_root(), contextlib.redirect_stdout(buf):
+        rc = _call_main(module, argv)
+    return json.loads(buf.getvalue()), rc
+
+
+def _newest(directory: Path, pattern: str) -> Path | None:
+    """Most recently modified match (one max() pass; no sort)."""
+    return max(directory.glob(pattern), key=lambda p: p.stat().st_mtime_ns, default=None)
+
+
+def _input_paths() -> list[str]:
+    """Every repo-relative file the pack (including its inner bundle/screenshot zips) is built from."""
+    bundle_include = importlib.import_module("package_sheets_approval_appsscript").DEFAULT_INCLUDE
+    rels: set[str] = set()
+    for rel in [*INCLUDE_FILES, *INCLUDE_DIRS, *bundle_include]:
+        p = ROOT / rel
+        if p.is_file():
+            rels.add(rel)
+            continue
+        for dirpath, _dirnames, filenames in os.walk(p):
+            for name in filenames:
+                rels.add(os.path.relpath(os.path.join(dirpath, name), ROOT).replace(os.sep, "/"))
+    return sorted(rels)
+
+
+def _input_digests(prev_files: dict) -> dict[str, list]:
+    """{rel: [mtime_ns, size, blake2b hex]} for the current inputs (check_screenshots.digest).
+
+    A file whose mtime_ns and size match the previous manifest keeps its old digest (no read);
+    the digest, not the mtime, decides whether anything changed, since the status reports are
+    rewritten on every run.
+    """
+    digest = importlib.import_module("check_screenshots").digest
+    out: dict[str, list] = {}
+    for rel in _input_paths():
+        p = ROOT / rel
+        try:
+            st = p.stat()
+        except OSError:
+            continue
+        prev = prev_files.get(rel)
+        if isinstance(prev, list) and len(prev) == 3 and prev[:2] == [st.st_mtime_ns, st.st_size]:
+            out[rel] = prev
+            continue
+        out[rel] = [st.st_mtime_ns, st.st_size, digest(p)]
+    return out
+
+
+def _load_manifest() -> dict:
+    try:
+        data = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _same_inputs(prev: dict, files: dict[str, list], options: dict) -> bool:
+    """True if the last build used the same options and file contents, and its outputs still exist."""
+    try:
+        if prev["options"] != options:
+            return False
+        if {k: v[1:] for k, v in prev["files"].items()} != {k: v[1:] for k, v in files.items()}:
+            return False
+        return all(Path(p).is_file() for p in prev["outputs"].values())
+    except (KeyError, TypeError, AttributeError):
+        return False
 
 
 def main() -> int:
@@ -65,39 +208,49 @@ def main() -> int:
         action="store_true",
         help="Fail the build if docs/screenshots/*.png are placeholders or known 'real-ish' mocks.",
     )
+    ap.add_argument(
+        "--force",
+        action="store_true",
+        help="Rebuild even if no inputs changed since the last pack (see dist/.marketplace-pack.manifest.json)",
+    )
     args = ap.parse_args()
 
     ts = dt.datetime.now(dt.timezone.utc).strftime("%Y%m%d-%H%M%SZ")
 
     # 0) Always refresh the real-screenshots status reports so the pack reflects current state.
-    _run([
-        "python3",
-        "scripts/check_screenshots.py",
+    # One in-process check_screenshots.py run writes both reports, prints the JSON status, and (with the
+    # optional guardrails) fails if screenshots aren't truly captured (placeholders / known mocks).
+    check_argv = [
         "--report-md",
         "docs/screenshots/REAL_SCREENSHOTS_STATUS.md",
-    ])
-    _run([
-        "python3",
-        "scripts/check_screenshots.py",
         "--report-html",
         "docs/screenshots/REAL_SCREENSHOTS_STATUS.html",
-    ])
-
-    ss = _run_json([
-        "python3",
-        "scripts/check_screenshots.py",
         "--json",
-    ])
+    ]
+    if args.require_real_screenshots:
+        check_argv += ["--fail-on-placeholders", "--fail-on-realish"]
+    ss, rc = _call_json("check_screenshots", check_argv)
     has_non_real = bool(ss.get("missing") or ss.get("placeholders") or ss.get("realish"))
-
-    # Optional guardrails: ensure screenshots are truly captured (not placeholders / not known mocks).
-    if args.require_real_screenshots and has_non_real:
-        _run([
-            "python3",
-            "scripts/check_screenshots.py",
-            "--fail-on-placeholders",
-            "--fail-on-realish",
-        ])
+    if rc != 0:
+        for key in ("missing", "placeholders", "realish"):
+            for item in ss.get(key) or []:
+                print(f"[screenshots] {key.upper()}: {item}", file=sys.stderr)
+        print(f"check_screenshots.py failed (exit={rc}); see docs/screenshots/REAL_SCREENSHOTS_STATUS.md", file=sys.stderr)
+        return rc
+
+    # Nothing changed since the last pack (same files, flags and screenshot status): reuse it.
+    prev = _load_manifest()
+    files = _input_digests(prev.get("files") or {})
+    options = {
+        "out": args.out,
+        "bundle_out": args.bundle_out,
+        "screens_out": args.screens_out,
+        "require_real_screenshots": args.require_real_screenshots,
+        "screenshots": {k: ss.get(k) or [] for k in ("missing", "placeholders", "realish")},
+    }
+    if not args.force and _same_inputs(prev, files, options):
+        print(f"No changes; reusing {prev['outputs']['pack']}")
+        return 0
 
     # If user didn't specify an output path, make the default filename explicit when it's a draft.
     if args.out:
@@ -108,62 +261,34 @@ def main() -> int:
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # 1) Build the inner artifacts.
+    # 1) Build the inner artifacts. They write independent outputs, so run both builders at once
+    # (in-process; --out is made absolute so neither depends on the working directory).
     bundle_out = args.bundle_out
+    bundle_argv = ["--out", str(ROOT / bundle_out)] if bundle_out else []
+    screens_out = args.screens_out
+    screens_argv = ["--out", str(ROOT / screens_out)] if screens_out else []
+
+    _call_parallel([
+        ("package_sheets_approval_appsscript", bundle_argv),
+        ("make_screenshot_pack", screens_argv),
+    ])
+
     if bundle_out:
-        _run(["python3", "scripts/package_sheets_approval_appsscript.py", "--out", bundle_out])
         bundle_path = ROOT / bundle_out
     else:
-        _run(["python3", "scripts/package_sheets_approval_appsscript.py"])
         # pick newest matching bundle
-        bundles = sorted(DIST.glob("sheets-approval-appsscript-bundle-*.zip"), key=lambda p: p.stat().st_mtime)
-        if not bundles:
+        bundle_path = _newest(DIST, "sheets-approval-appsscript-bundle-*.zip")
+        if bundle_path is None:
             raise SystemExit("No bundle zip found under dist/. Did packaging fail?")
-        bundle_path = bundles[-1]
 
-    screens_out = args.screens_out
     if screens_out:
-        _run(["python3", "scripts/make_screenshot_pack.py", "--out", screens_out])
         screens_path = ROOT / screens_out
     else:
-        _run(["python3", "scripts/make_screenshot_pack.py"])
-        packs = sorted(DIST.glob("screenshot-pack-*.zip"), key=lambda p: p.stat().st_mtime)
-        if not packs:
+        screens_path = _newest(DIST, "screenshot-pack-*.zip")
+        if screens_path is None:
             raise SystemExit("No screenshot pack zip found under dist/. Did make_screenshot_pack fail?")
-        screens_path = packs[-1]
 
     # 2) Create the final marketplace pack.
-    include_files = [
-        # top-level navigation / quickstart
-        "START_HERE.md",
-        "README.md",
-        "QUICKSTART.md",
-        "SETUP-CHECKLIST.md",
-        "TROUBLESHOOTING.md",
-        "UNINSTALL.md",
-        "TEMPLATE-INSTRUCTIONS.md",
-        "CHANGELOG.md",
-
-        # product + delivery docs
-        "CLIENT-HANDOFF.md",
-        "ONE_PAGER.md",
-        "DEMO.md",
-        "DEMO-WALKTHROUGH.md",
-        "DEMO-TEMPLATE.md",
-
-        # screenshots
-        "SCREENSHOTS.md",
-        "REAL_SCREENSHOTS_GUIDE.md",
-
-        # marketplace / sales assets
-        "LISTING.md",
-        "MARKETPLACE-LISTING-COPY.md",
-        "MARKETPLACE-CHECKLIST.md",
-        "SALES.md",
-        "OUTREACH-TEMPLATES.md",
-        "INTAKE_QUESTIONS.md",
-    ]
-
     with zipfile.ZipFile(out_path, "w", compression=zipfile.ZIP_DEFLATED) as z:
         if not args.require_real_screenshots and has_non_real:
             missing = ss.get("missing") or []
@@ -204,27 +329,36 @@ def main() -> int:
                 ),
             )
 
-        # docs/copy
-        for rel in include_files:
-            p = ROOT / rel
-            if p.exists() and p.is_file():
-                z.write(p, f"marketplace-pack/{rel}")
+        # docs/copy (top-level names are checked against one listing of ROOT instead of a stat each)
+        with os.scandir(ROOT) as it:
+            root_files = {e.name for e in it if e.is_file()}
+        for rel in INCLUDE_FILES:
+            if rel in root_files if "/" not in rel else os.path.isfile(ROOT / rel):
+                z.write(ROOT / rel, f"marketplace-pack/{rel}")
 
-        # inner zips
-        z.write(bundle_path, f"marketplace-pack/dist/{bundle_path.name}")
-        z.write(screens_path, f"marketplace-pack/dist/{screens_path.name}")
+        # inner zips (already deflated: store as-is)
+        z.write(bundle_path, f"marketplace-pack/dist/{bundle_path.name}", compress_type=zipfile.ZIP_STORED)
+        z.write(screens_path, f"marketplace-pack/dist/{screens_path.name}", compress_type=zipfile.ZIP_STORED)
 
         # convenience: include rendered landing page + screenshots directory
-        for sub in ["landing", "docs/screenshots"]:
+        for sub in INCLUDE_DIRS:
             base = ROOT / sub
             if not base.exists():
                 continue
-            for fp in sorted(base.rglob("*")):
-                if fp.is_dir():
-                    continue
-                if fp.name in {".DS_Store"}:
-                    continue
-                z.write(fp, f"marketplace-pack/{fp.relative_to(ROOT)}")
+            # os.walk hands back files and dirs already split: no per-entry is_dir() stat.
+            for dirpath, dirnames, filenames in os.walk(base):
+                dirnames.sort()
+                arc_dir = "marketplace-pack/" + os.path.relpath(dirpath, ROOT).replace(os.sep, "/") + "/"
+                for name in sorted(filenames):
+                    if name in {".DS_Store"}:
+                        continue
+                    # One read() per file instead of ZipFile.write's chunked copy; ZipInfo.from_file
+                    # keeps the same timestamp/permission metadata write() would record.
+                    src = os.path.join(dirpath, name)
+                    zi = zipfile.ZipInfo.from_file(src, arc_dir + name)
+                    zi.compress_type = compress_type(name)
+                    with open(src, "rb") as f:
+                        z.writestr(zi, f.read())
 
     # 3) Write stable "latest" pointers for convenience (easy upload scripts, etc.).
     # Keep both DRAFT and non-draft latest names so callers can pin what they want.
@@ -243,6 +377,20 @@ def main() -> int:
     if has_non_real and not args.require_real_screenshots:
         _write_latest(out_path, "marketplace-pack-DRAFT-latest.zip")
 
+    MANIFEST_PATH.write_text(
+        json.dumps(
+            {
+                "options": options,
+                "outputs": {"pack": str(out_path), "bundle": str(bundle_path), "screens": str(screens_path)},
+                "files": files,
+            },
+            indent=2,
+            sort_keys=True,
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+
     size_kb = out_path.stat().st_size / 1024.0
     print(f"Wrote: {out_path} ({size_kb:.1f} KB)")
     return 0
@@ -21,19 +21,27 @@ Usage:
 
 After unzipping on the capture machine:
   python3 scripts/install_real_screenshots.py --from ~/Desktop --check
+Optional: with `pip install isal` the zip is deflated by ISA-L (faster, same format; see scripts/_zip_util.py).
 """
 
 from __future__ import annotations
 
 import argparse
+import contextlib
+import hashlib
+import io
 import os
 from pathlib import Path
-import subprocess
+import shutil
 import time
 import zipfile
 
+# scripts/ is on sys.path when this runs as a script.
+from _zip_util import add_bytes, add_file, compress_type, existing_files
+
 
 ROOT = Path(__file__).resolve().parents[1]
+STATUS_CACHE_DIR = ROOT / ".cache"
 
 INCLUDE_PATHS = [
     # The script itself (so the capture machine doesn't need a full repo checkout)
@@ -46,7 +54,7 @@ INCLUDE_PATHS = [
     Path("docs/screenshots/CAPTURE-CHEATSHEET.md"),
     Path("docs/screenshots/manifest.json"),
 
-    # Handy printable views (generated from manifest.json)
+    # Handy printable views (rendered from manifest.json at packaging time)
     Path("docs/screenshots/deck.html"),
     Path("docs/screenshots/gallery.html"),
     Path("docs/screenshots/capture-checklist.html"),
@@ -61,92 +69,8 @@ INCLUDE_PATHS = [
 ]
 
 
-def _timestamp_slug() -> str:
-    # UTC timestamp, filesystem safe.
-    return time.strftime("%Y%m%d-%H%M%SZ", time.gmtime())
-
-
-def _build_status_report_md() -> str:
-    """Generate a Markdown status report describing current screenshot state.
-
-    This is intended as a convenience inside the capture pack zip so whoever
-    is capturing screenshots can see exactly what’s missing (without running
-    anything first).
-
-    Best-effort: if generation fails for any reason, return a short note.
-    """
-
-    try:
-        tmp = ROOT / "tmp"
-        tmp.mkdir(parents=True, exist_ok=True)
-        out = tmp / "real-screenshots-status.md"
-
-        # Best-effort: always succeed (check_screenshots may exit non-zero when
-        # placeholders/real-ish are present).
-        subprocess.run(
-            [
-                "python3",
-                str(ROOT / "scripts" / "check_screenshots.py"),
-                "--report-md",
-                str(out),
-            ],
-            check=False,
-            cwd=str(ROOT),
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
-
-        if out.exists():
-            return out.read_text(encoding="utf-8")
-    except Exception:
-        pass
-
-    return (
-        "# Real screenshots status\n\n"
-        "(Status report generation failed on the packaging machine.)\n\n"
-        "Run this after unzipping:\n\n"
-        "```bash\n"
-        "python3 scripts/check_screenshots.py --report-md tmp/real-screenshots-status.md\n"
-        "```\n"
-    )
-
-
-def main() -> int:
-    ap = argparse.ArgumentParser()
-    ap.add_argument(
-        "--out",
-        help="Output zip path (default: dist/real-screenshots-capture-pack-<ts>.zip)",
-        default=None,
-    )
-    args = ap.parse_args()
-
-    out_path = (
-        Path(args.out)
-        if args.out
-        else ROOT / "dist" / f"real-screenshots-capture-pack-{_timestamp_slug()}.zip"
-    )
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-
-    # When using the default output path, also maintain a stable “latest” filename
-    # so humans can just grab one file without hunting for the newest timestamp.
-    latest_path = None if args.out else (ROOT / "dist" / "real-screenshots-capture-pack-DRAFT-latest.zip")
-
-    missing: list[str] = []
-    for rel in INCLUDE_PATHS:
-        p = ROOT / rel
-        if not p.exists():
-            missing.append(str(rel))
-
-    if missing:
-        raise SystemExit(
-            "Missing required files (did you move things?):\n  - "
-            + "\n  - ".join(missing)
-        )
-
-    # Write zip
-    with zipfile.ZipFile(out_path, "w", compression=zipfile.ZIP_DEFLATED) as z:
-        # Helpful top-level README inside the zip
-        readme = """# Sheets Approvals — REAL screenshots capture pack
+# Generated entries, encoded once (writestr then takes the bytes as-is).
+README_CAPTURE_PACK = """# Sheets Approvals — REAL screenshots capture pack
 
 Goal: replace placeholder screenshots under `docs/screenshots/*.png` with **REAL** captures from an actual Google Sheet.
 
@@ -219,17 +143,9 @@ python3 scripts/screenshots_pipeline.py --make-gif --gif-width 900 --gif-ms 900
 Notes:
 - This pack intentionally does NOT include any screenshots.
 - No Google login automation is attempted.
-"""
-        z.writestr("README_CAPTURE_PACK.md", readme)
+""".encode("utf-8")
 
-        # Convenience: include a pre-generated status report so the capturer can
-        # immediately see what needs to be replaced.
-        z.writestr("REAL_SCREENSHOTS_STATUS.md", _build_status_report_md())
-
-        # Convenience: a double-clickable macOS runner.
-        # - .command files are meant to be executed by Terminal on macOS.
-        # - This is best-effort; if you're on Linux/Windows you can ignore it.
-        capture_cmd = """#!/bin/bash
+CAPTURE_MAC_COMMAND = """#!/bin/bash
 set -euo pipefail
 
 HERE="$(cd "$(dirname "$0")" && pwd)"
@@ -267,21 +183,151 @@ fi
 
 echo "[capture] If you want to re-run verification later:"
 echo "  python3 scripts/check_screenshots.py --report-md docs/screenshots/REAL_SCREENSHOTS_STATUS.md"
-"""
-        zi = zipfile.ZipInfo("CAPTURE_MAC.command")
+""".encode("utf-8")
+
+
+def _timestamp_slug() -> str:
+    # UTC timestamp, filesystem safe.
+    return time.strftime("%Y%m%d-%H%M%SZ", time.gmtime())
+
+
+def _status_inputs_key() -> str:
+    """Digest of the names + mtimes of everything check_screenshots.py's report depends on."""
+    shots = ROOT / "docs" / "screenshots"
+    inputs = [
+        *shots.glob("*.png"),
+        *(shots / "png").glob("*.png"),
+        shots / "manifest.json",
+        shots / "realish-hashes.json",
+        ROOT / "scripts" / "check_screenshots.py",
+        ROOT / "scripts" / "_realish_hashes.py",
+    ]
+    h = hashlib.blake2b(digest_size=8)
+    for p in sorted(inputs):
+        try:
+            mtime_ns = p.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = 0
+        h.update(str(p.relative_to(ROOT)).encode() + b"\0" + mtime_ns.to_bytes(8, "little"))
+    return h.hexdigest()
+
+
+def _build_status_report_md() -> str:
+    """Generate a Markdown status report describing current screenshot state.
+
+    This is intended as a convenience inside the capture pack zip so whoever
+    is capturing screenshots can see exactly what’s missing (without running
+    anything first).
+
+    Best-effort: if generation fails for any reason, return a short note.
+
+    The report only changes when the screenshots (or the checker) do, so it is cached under
+    .cache/ keyed on their names + mtimes; a fresh cache entry skips running the checker.
+    """
+
+    try:
+        key = _status_inputs_key()
+        cache = STATUS_CACHE_DIR / f"capture-pack-status-{key}.md"
+        if cache.is_file():
+            return cache.read_text(encoding="utf-8")
+
+        tmp = ROOT / "tmp"
+        tmp.mkdir(parents=True, exist_ok=True)
+        out = tmp / "real-screenshots-status.md"
+
+        # Best-effort: always succeed (check_screenshots may exit non-zero when
+        # placeholders/real-ish are present). In-process (scripts/ is on sys.path when this
+        # runs as a script); its console output is discarded.
+        import check_screenshots
+
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            try:
+                check_screenshots.main(["--report-md", str(out)])
+            except SystemExit:
+                pass
+
+        if out.exists():
+            text = out.read_text(encoding="utf-8")
+            STATUS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            for stale in STATUS_CACHE_DIR.glob("capture-pack-status-*.md"):
+                stale.unlink(missing_ok=True)
+            cache.write_text(text, encoding="utf-8")
+            return text
+    except Exception:
+        pass
+
+    return (
+        "# Real screenshots status\n\n"
+        "(Status report generation failed on the packaging machine.)\n\n"
+        "Run this after unzipping:\n\n"
+        "```bash\n"
+        "python3 scripts/check_screenshots.py --report-md tmp/real-screenshots-status.md\n"
+        "```\n"
+    )
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument(
+        "--out",
+        help="Output zip path (default: dist/real-screenshots-capture-pack-<ts>.zip)",
+        default=None,
+    )
+    args = ap.parse_args()
+
+    out_path = (
+        Path(args.out)
+        if args.out
+        else ROOT / "dist" / f"real-screenshots-capture-pack-{_timestamp_slug()}.zip"
+    )
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # When using the default output path, also maintain a stable “latest” filename
+    # so humans can just grab one file without hunting for the newest timestamp.
+    latest_path = None if args.out else (ROOT / "dist" / "real-screenshots-capture-pack-DRAFT-latest.zip")
+
+    # The manifest-driven views (README + gallery/deck/checklist HTML) are rendered in memory
+    # from manifest.json, so the pack never carries stale copies and they aren't re-read from disk.
+    # In-process: scripts/ is on sys.path when this runs as a script.
+    import render_screenshots_gallery
+
+    rendered = {path.relative_to(ROOT): text for path, text in render_screenshots_gallery.render().items()}
+
+    on_disk = [rel for rel in INCLUDE_PATHS if rel not in rendered]
+    present = existing_files([ROOT / rel for rel in on_disk])
+    missing = [str(rel) for rel in on_disk if ROOT / rel not in present]
+
+    if missing:
+        raise SystemExit(
+            "Missing required files (did you move things?):\n  - "
+            + "\n  - ".join(missing)
+        )
+
+    # Write zip. Level 1: the payload is small text, where level 6 buys almost nothing.
+    with zipfile.ZipFile(out_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as z:
+        # Helpful top-level README inside the zip
+        add_bytes(z, "README_CAPTURE_PACK.md", README_CAPTURE_PACK)
+
+        # Convenience: include a pre-generated status report so the capturer can
+        # immediately see what needs to be replaced.
+        add_bytes(z, "REAL_SCREENSHOTS_STATUS.md", _build_status_report_md())
+
+        # Convenience: a double-clickable macOS runner.
+        # - .command files are meant to be executed by Terminal on macOS.
+        # - This is best-effort; if you're on Linux/Windows you can ignore it.
         # Mark as executable (0755) on Unix-y systems so macOS can double-click it.
-        zi.external_attr = 0o755 << 16
-        z.writestr(zi, capture_cmd)
+        add_bytes(z, "CAPTURE_MAC.command", CAPTURE_MAC_COMMAND, mode=0o755)
 
         for rel in INCLUDE_PATHS:
+            if rel in rendered:
+                add_bytes(z, str(rel), rendered[rel].encode("utf-8"))
+                continue
             src = ROOT / rel
-            z.write(src, arcname=str(rel))
+            add_file(z, src, str(rel), compress_type(src.name))
 
     # Keep a stable “latest” copy for convenience (best-effort).
     if latest_path is not None:
         try:
-            import shutil
-
             shutil.copyfile(out_path, latest_path)
             latest_kb = os.path.getsize(latest_path) / 1024
             print(f"Wrote {latest_path} ({latest_kb:.1f} KB)")
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-"""Generate an animated GIF preview from the screenshot set.
+"""Generate an animated GIF (or WebP) preview from the screenshot set.
 
 This keeps docs/screenshots/approval-flow.gif in sync with the canonical
 screenshot ordering defined by docs/screenshots/manifest.json.
@@ -10,7 +10,7 @@ Fallback:
 - docs/screenshots/<file> (from manifest)
 
 Output:
-- docs/screenshots/approval-flow.gif
+- docs/screenshots/approval-flow.gif (or approval-flow.webp with --format webp)
 
 Usage:
   python3 scripts/make_screenshot_gif.py
@@ -19,6 +19,8 @@ Options:
   --max-width 900        Downscale frames wider than this (keeps aspect)
   --duration-ms 900      Frame duration in ms
   --pause-ms 1500        Extra pause on the last frame
+  --format gif           gif (default; what the docs/landing embed) or webp: full-color
+                         animated WebP, no 256-color palette/dithering pass
 """
 
 from __future__ import annotations
@@ -82,13 +84,14 @@ def main() -> int:
     ap.add_argument("--max-width", type=int, default=900)
     ap.add_argument("--duration-ms", type=int, default=900)
     ap.add_argument("--pause-ms", type=int, default=1500)
+    ap.add_argument("--format", choices=["gif", "webp"], default="gif")
     args = ap.parse_args()
 
     root = Path(__file__).resolve().parents[1]
     docs_dir = root / "docs" / "screenshots"
     optimized_dir = docs_dir / "optimized"
     manifest_path = docs_dir / "manifest.json"
-    out_path = docs_dir / "approval-flow.gif"
+    out_path = docs_dir / f"approval-flow.{args.format}"
 
     items = _load_manifest_items(manifest_path)
     srcs = [_best_image_path(docs_dir, optimized_dir, it) for it in items]
@@ -99,6 +102,10 @@ def main() -> int:
 
     for p in srcs:
         im = Image.open(p)
+        if args.max_width and im.width > args.max_width:
+            # JPEG only (a no-op for PNG): let libjpeg decode at 1/2, 1/4 or 1/8 scale when
+            # that still leaves at least --max-width to resize down from.
+            im.draft("RGB", (args.max_width, im.height * args.max_width // im.width))
         im.load()
 
         # Normalize to RGB and downscale for size control.
@@ -111,6 +118,10 @@ def main() -> int:
 
         if args.max_width and im.width > args.max_width:
             h = int(im.height * (args.max_width / im.width))
+            # Cheap 2x box reductions first (PNG inputs; JPEGs were already scaled by draft()),
+            # so the LANCZOS pass only covers the last <2x.
+            while im.width >= args.max_width * 2:
+                im = im.reduce(2)
             im = im.resize((args.max_width, h), Image.Resampling.LANCZOS)
 
         frames.append(im)
@@ -119,22 +130,40 @@ def main() -> int:
 
     padded = [_pad_to(f, max_w, max_h) for f in frames]
 
-    # Convert to palette images to keep file size sane.
-    pal_frames: list[Image.Image] = []
-    for im in padded:
-        pal = im.convert(
-            "P",
-            palette=Image.Palette.ADAPTIVE,
-            colors=256,
-            dither=Image.Dither.FLOYDSTEINBERG,
-        )
-        pal_frames.append(pal)
-
-    durations = [max(1, args.duration_ms)] * len(pal_frames)
+    durations = [max(1, args.duration_ms)] * len(padded)
     if durations:
         durations[-1] += max(0, args.pause_ms)
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
+    if args.format == "webp":
+        # Lossy WebP keeps full color, so the palette/dither stage below isn't needed. method=4:
+        # method=6 only shaves ~2 KB more here and takes ~6x longer.
+        padded[0].save(
+            out_path,
+            save_all=True,
+            append_images=padded[1:],
+            duration=durations,
+            loop=0,
+            lossless=False,
+            quality=80,
+            method=4,
+        )
+        print(f"Wrote: {out_path} ({out_path.stat().st_size/1024:.1f} KB)")
+        return 0
+
+    # Convert to palette images to keep file size sane. The frames share most of their colors
+    # (same Sheets chrome), so one median-cut palette is built from a 1/4-scale stack of all
+    # frames and mapped onto each without dithering: stable indices frame to frame, no per-frame
+    # quantize + error-diffusion pass.
+    thumbs = [im.reduce(4) for im in padded]
+    sample = Image.new("RGB", (max_w // 4, sum(t.height for t in thumbs)))
+    y = 0
+    for t in thumbs:
+        sample.paste(t, (0, y))
+        y += t.height
+    palette_img = sample.quantize(colors=256, method=Image.Quantize.MEDIANCUT)
+    pal_frames = [im.quantize(palette=palette_img, dither=Image.Dither.NONE) for im in padded]
+
     pal_frames[0].save(
         out_path,
         save_all=True,
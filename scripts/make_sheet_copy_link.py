@@ -21,18 +21,13 @@ import re
 import sys
 
 
-SHEET_ID_RE = re.compile(r"/spreadsheets/d/([a-zA-Z0-9-_]+)")
-BARE_ID_RE = re.compile(r"^[a-zA-Z0-9-_]{20,}$")
+# One pass: a /spreadsheets/d/<id> URL anywhere in the input, or the whole input as a bare ID.
+SHEET_ID_RE = re.compile(r"/spreadsheets/d/([a-zA-Z0-9-_]+)|^([a-zA-Z0-9-_]{20,})$")
 
 
 def extract_sheet_id(s: str) -> str | None:
-    s = s.strip()
-    m = SHEET_ID_RE.search(s)
-    if m:
-        return m.group(1)
-    if BARE_ID_RE.match(s):
-        return s
-    return None
+    m = SHEET_ID_RE.search(s.strip())
+    return m[m.lastindex] if m else None
 
 
 def main(argv: list[str]) -> int:
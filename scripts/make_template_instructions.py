@@ -19,41 +19,14 @@ Output:
 
 from __future__ import annotations
 
-import re
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
 
+# Same URL/ID parsing as the copy-link script (scripts/ is on sys.path when this runs as a script).
+from make_sheet_copy_link import extract_sheet_id
 
-SHEET_ID_RE = re.compile(r"/spreadsheets/d/([a-zA-Z0-9-_]+)")
-BARE_ID_RE = re.compile(r"^[a-zA-Z0-9-_]{20,}$")
 
-
-def extract_sheet_id(s: str) -> str | None:
-    s = s.strip()
-    m = SHEET_ID_RE.search(s)
-    if m:
-        return m.group(1)
-    if BARE_ID_RE.match(s):
-        return s
-    return None
-
-
-def main(argv: list[str]) -> int:
-    if len(argv) != 2 or argv[1] in {"-h", "--help"}:
-        print(__doc__.strip())
-        return 2
-
-    sheet_id = extract_sheet_id(argv[1])
-    if not sheet_id:
-        print("ERROR: could not extract a Google Sheet ID from input.", file=sys.stderr)
-        return 1
-
-    copy_url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/copy"
-    edit_url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/edit"
-
-    today = datetime.utcnow().strftime("%Y-%m-%d")
-
-    md = f"""# Google Sheets Approvals + Audit Trail — Template Install (Make a Copy)
+_TEMPLATE = """# Google Sheets Approvals + Audit Trail — Template Install (Make a Copy)
 
 _Last updated: {today}_
 
@@ -100,7 +73,29 @@ Open this link and click **Make a copy**:
 If you want a “copy/paste installer” approach instead, see `DEMO-TEMPLATE.md` in the repo.
 """
 
-    print(md)
+
+def build_install_markdown(sheet_id: str, today: str | None = None) -> str:
+    """The Markdown guide for sheet_id; today defaults to the current UTC date (YYYY-MM-DD)."""
+    if today is None:
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    return _TEMPLATE.format(
+        today=today,
+        copy_url=f"https://docs.google.com/spreadsheets/d/{sheet_id}/copy",
+        edit_url=f"https://docs.google.com/spreadsheets/d/{sheet_id}/edit",
+    )
+
+
+def main(argv: list[str]) -> int:
+    if len(argv) != 2 or argv[1] in {"-h", "--help"}:
+        print(__doc__.strip())
+        return 2
+
+    sheet_id = extract_sheet_id(argv[1])
+    if not sheet_id:
+        print("ERROR: could not extract a Google Sheet ID from input.", file=sys.stderr)
+        return 1
+
+    print(build_install_markdown(sheet_id))
     return 0
 
 
@@ -6,6 +6,7 @@ Why: makes it easy to hand a client a single artifact containing Code.gs + docs
 Usage:
   python3 scripts/package_sheets_approval_appsscript.py
   python3 scripts/package_sheets_approval_appsscript.py --out dist/sheets-approval.zip
+  python3 scripts/package_sheets_approval_appsscript.py --store
 
 By default writes to:
   dist/sheets-approval-appsscript-bundle-<timestamp>.zip
@@ -53,15 +54,20 @@ def _git_sha() -> str | None:
         return None
 
 
-def _sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
-    return h.hexdigest()
+def _add_hashed(z: zipfile.ZipFile, src: Path, arcname: str) -> tuple[str, int]:
+    """z.write(src, arcname), hashing the bytes on the way in: returns (sha256 hex, size).
 
+    One read of the file feeds both the zip entry and the manifest digest. ZipInfo.from_file
+    keeps the timestamp/permissions write() records; the zip's compression settings go
+    through writestr's own arguments.
+    """
+    zi = zipfile.ZipInfo.from_file(src, arcname)
+    data = src.read_bytes()
+    z.writestr(zi, data, compress_type=z.compression, compresslevel=z.compresslevel)
+    return hashlib.sha256(data).hexdigest(), len(data)
 
-def main() -> int:
+
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument(
         "--out",
@@ -74,7 +80,16 @@ def main() -> int:
         default=[],
         help="Additional relative paths under secret-project-2/sheets-approval-appsscript to include",
     )
-    args = ap.parse_args()
+    ap.add_argument(
+        "--compresslevel",
+        type=int,
+        choices=range(10),
+        default=1,
+        metavar="0-9",
+        help="DEFLATE level (default: 1; the bundle is small text, higher levels barely shrink it)",
+    )
+    ap.add_argument("--store", action="store_true", help="Store files uncompressed (ZIP_STORED)")
+    args = ap.parse_args(argv)
 
     ts = dt.datetime.now(dt.timezone.utc).strftime("%Y%m%d-%H%M%SZ")
     out_path = Path(args.out) if args.out else (ROOT / "dist" / f"sheets-approval-appsscript-bundle-{ts}.zip")
@@ -119,15 +134,19 @@ def main() -> int:
         "files": [],
     }
 
-    with zipfile.ZipFile(out_path, "w", compression=zipfile.ZIP_DEFLATED) as z:
+    if args.store:
+        zip_opts = {"compression": zipfile.ZIP_STORED}
+    else:
+        zip_opts = {"compression": zipfile.ZIP_DEFLATED, "compresslevel": args.compresslevel}
+    with zipfile.ZipFile(out_path, "w", **zip_opts) as z:
         for src, rel in files:
             arcname = f"sheets-approval-appsscript/{rel}"
-            z.write(src, arcname)
+            sha256, size = _add_hashed(z, src, arcname)
             manifest["files"].append(
                 {
                     "path": rel,
-                    "sha256": _sha256_file(src),
-                    "bytes": src.stat().st_size,
+                    "sha256": sha256,
+                    "bytes": size,
                 }
             )
 
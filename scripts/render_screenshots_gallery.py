@@ -27,8 +27,14 @@ OUT_DECK = SHOT_DIR / "deck.html"
 OUT_CAPTURE = SHOT_DIR / "capture-checklist.html"
 
 
-def main() -> int:
-    data = json.loads(MANIFEST.read_text(encoding="utf-8"))
+def render(data: dict | None = None) -> dict[Path, str]:
+    """Render every output from the manifest (read from disk unless given) without writing anything.
+
+    Returns {output path: text}, in the order main() writes them.
+    """
+    if data is None:
+        data = json.loads(MANIFEST.read_text(encoding="utf-8"))
+    outputs: dict[Path, str] = {}
     title = data.get("title", "Screenshots")
     items = data.get("items", [])
 
@@ -99,7 +105,7 @@ def main() -> int:
     md.append("```bash\npython3 scripts/make_screenshot_pack.py\n```\n\n")
     md.append("Output:\n- `dist/screenshot-pack-YYYYMMDD-HHMM.zip`\n")
 
-    OUT_README.write_text("".join(md), encoding="utf-8")
+    outputs[OUT_README] = "".join(md)
 
     # gallery.html
     parts = []
@@ -135,7 +141,7 @@ def main() -> int:
         parts.append("  </div>\n")
 
     parts.append("</body>\n</html>\n")
-    OUT_HTML.write_text("".join(parts), encoding="utf-8")
+    outputs[OUT_HTML] = "".join(parts)
 
     # deck.html (print-friendly)
     deck = []
@@ -183,7 +189,7 @@ def main() -> int:
         deck.append("  </section>\n")
 
     deck.append("</body>\n</html>\n")
-    OUT_DECK.write_text("".join(deck), encoding="utf-8")
+    outputs[OUT_DECK] = "".join(deck)
 
     # capture-checklist.html (printable checklist + thumbnails)
     #
@@ -329,12 +335,15 @@ def main() -> int:
         cap.append("  </section>\n")
 
     cap.append("</body>\n</html>\n")
-    OUT_CAPTURE.write_text("".join(cap), encoding="utf-8")
+    outputs[OUT_CAPTURE] = "".join(cap)
+
+    return outputs
 
-    print(f"Wrote {OUT_README.relative_to(ROOT)}")
-    print(f"Wrote {OUT_HTML.relative_to(ROOT)}")
-    print(f"Wrote {OUT_DECK.relative_to(ROOT)}")
-    print(f"Wrote {OUT_CAPTURE.relative_to(ROOT)}")
+
+def main() -> int:
+    for path, text in render().items():
+        path.write_text(text, encoding="utf-8")
+        print(f"Wrote {path.relative_to(ROOT)}")
     return 0
 
 
@@ -22,12 +22,14 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import hashlib
 import json
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 
+# Same hashing as the realness gate (scripts/ is on sys.path when this runs as a script).
+from check_screenshots import digest
+
 ROOT = Path(__file__).resolve().parents[1]
 TOP = ROOT / "docs" / "screenshots"
 PLACEHOLDER_DIR = TOP / "png"
@@ -44,14 +46,6 @@ class Row:
     caption: str
 
 
-def sha256_file(p: Path) -> str:
-    h = hashlib.sha256()
-    with p.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
-    return h.hexdigest()
-
-
 def load_manifest() -> list[Row]:
     data = json.loads(MANIFEST_PATH.read_text("utf-8"))
     items = data.get("items") or []
@@ -77,11 +71,13 @@ def main() -> int:
         raise SystemExit(f"Missing manifest: {MANIFEST_PATH}")
 
     realish_hashes: dict[str, str] = {}
+    realish_algo = "sha256"
     if REALISH_HASHES_PATH.exists():
         rh = json.loads(REALISH_HASHES_PATH.read_text("utf-8"))
-        # Format: { kind, generatedAt, files: { "01-menu.png": "<sha256>" } }
+        # Format: { kind, generatedAt, algo?, files: { "01-menu.png": "<digest>" } } (no algo => sha256)
         if isinstance(rh, dict) and isinstance(rh.get("files"), dict):
             realish_hashes = {str(k): str(v) for k, v in rh["files"].items()}
+            realish_algo = str(rh.get("algo") or "sha256")
 
     rows = load_manifest()
     now = datetime.now(timezone.utc)
@@ -113,10 +109,10 @@ def main() -> int:
             notes.append("canonical file missing")
             actionable_missing.append(r)
         else:
-            out_hash = sha256_file(out_path)
+            out_hash = digest(out_path, realish_algo)
             realish_hash = realish_hashes.get(r.file)
 
-            ph_hash = sha256_file(ph_path) if ph_path.exists() else None
+            ph_hash = digest(ph_path, realish_algo) if ph_path.exists() else None
 
             if ph_hash and out_hash == ph_hash:
                 status = "placeholder"